@@ -8,16 +8,109 @@ for common migrations, providing detailed metrics comparison.
 
 import argparse
 import csv
+import io
 import json
 import os
 import re
 import sys
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from html import escape
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, NoReturn, Optional, Set, TextIO, Tuple
 
-@dataclass
+try:
+    import orjson  # optional: faster decoding of the per-migration JSON reports
+except ImportError:
+    orjson = None
+
+# Output file buffer size for report writers (1 MiB)
+REPORT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Data row layout of the comparison CSV (see save_comparison_csv fieldnames): migration id,
+# data size and execution times (2 decimals), worker/CPU counts, CPU times and efficiency
+# (2 decimals), then per-tier worker/straggler/CPU counts for each execution
+CSV_ROW_FORMAT = ",".join(["%s"] + ["%.2f"] * 4 + ["%s"] * 6 + ["%.2f"] * 9 + ["%s"] * 18)
+CSV_LINE_TERMINATOR = "\r\n"  # same terminator csv.writer uses by default
+
+# Name prefixes of migration directories inside a tiered run directory
+MIGRATION_DIR_PREFIXES = ('mig', 'migration')
+
+# Simulation tiers, in report order
+TIERS = ('SMALL', 'MEDIUM', 'LARGE')
+
+# Default count for each tier, for per-tier dict lookups in TIERS order
+TIER_ZERO_COUNTS = (0, 0, 0)
+
+# Simulation config key holding the threads per worker of each tier
+TIER_THREADS_KEYS = {tier: f'{tier.lower()}_threads' for tier in TIERS}
+
+# Metric fields summed into TieredAggregateTotals, in unpacking order
+AGGREGATE_METRIC_FIELDS = attrgetter('total_execution_time', 'total_workers', 'total_cpus', 'cpu_time', 'total_data_size_gb')
+
+# Execution report parsing: the body of each MIGRATION CONFIGURATION section (up to the next
+# SIMULATION CONFIGURATION / PER-MIGRATION heading) and its "key: value" lines, skipping "---" rules
+# and repeated section headings
+MIGRATION_CONFIG_SECTION_RE = re.compile(
+    r'^[^\S\n]*MIGRATION CONFIGURATION[^\n]*\n?(.*?)(?=^[^\S\n]*(?:SIMULATION CONFIGURATION|PER-MIGRATION)|\Z)',
+    re.MULTILINE | re.DOTALL)
+CONFIG_LINE_RE = re.compile(r'^[^\S\n]*(?![-\s]|MIGRATION CONFIGURATION)([^:\n]*):([^\n]*)$', re.MULTILINE)
+# Config values converted to int (no decimal point) or float
+NUMERIC_VALUE_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+
+# Configuration parameters compared at the top of the text and HTML reports
+CONFIG_COMPARISON_KEYS = (
+    'small_tier_max_sstable_size_gb',
+    'small_tier_thread_subset_max_size_floor_gb',
+    'small_tier_worker_num_threads',
+    'medium_tier_max_sstable_size_gb',
+    'medium_tier_thread_subset_max_size_floor_gb',
+    'medium_tier_worker_num_threads',
+    'optimize_packing_medium_subsets',
+    'skip_small_subsets',
+    'execution_mode',
+    'max_concurrent_workers'
+)
+
+# Subset of CONFIG_COMPARISON_KEYS listed in the CSV header comments
+CSV_CONFIG_COMPARISON_KEYS = (
+    'small_tier_max_sstable_size_gb',
+    'small_tier_thread_subset_max_size_floor_gb',
+    'small_tier_worker_num_threads',
+    'medium_tier_max_sstable_size_gb',
+    'medium_tier_worker_num_threads',
+    'optimize_packing_medium_subsets',
+    'execution_mode',
+    'max_concurrent_workers'
+)
+
+# Migration config names that map onto differently named simulation config keys
+SIMULATION_CONFIG_KEY_MAPPING = {
+    'small_tier_worker_num_threads': 'small_threads',
+    'medium_tier_worker_num_threads': 'medium_threads',
+    'large_tier_worker_num_threads': 'large_threads'  # This is always 1
+}
+
+# Migration parameters that should be looked up directly in migration config
+MIGRATION_CONFIG_PARAMS = frozenset([
+    'small_tier_max_sstable_size_gb',
+    'small_tier_thread_subset_max_size_floor_gb',
+    'medium_tier_max_sstable_size_gb',
+    'medium_tier_thread_subset_max_size_floor_gb',
+    'optimize_packing_medium_subsets',
+    'skip_small_subsets',
+    'max_num_sstables_per_subset'
+])
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ for the per-migration records;
+# older interpreters fall back to regular dataclasses
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class TieredMigrationMetrics:
     """Stores metrics for a single tiered migration execution."""
     migration_id: str
@@ -36,95 +129,76 @@ class TieredMigrationMetrics:
     total_active_cpu_time: float = 0.0  # total actual processing time
     cpu_inefficiency: float = 0.0  # idle/wasted CPU time
     average_cpu_efficiency_percent: float = 0.0  # average efficiency across workers
+    # Straggler workers across all tiers, computed once in __post_init__ (slots rule out cached_property);
+    # a snapshot of stragglers_by_tier at construction, left out of equality
+    total_stragglers: int = field(init=False, compare=False)
+    
+    def __post_init__(self):
+        self.total_stragglers = sum(self.stragglers_by_tier.values())
     
-@dataclass
+def _load_json_report(json_file: Path) -> Dict[str, any]:
+    """Load a JSON execution report, using orjson when it is installed."""
+    if orjson is not None:
+        with open(json_file, 'rb') as f:
+            content = f.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json.dump writes for non-finite values
+            return json.loads(content)
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _safe_ratio(numerator: float, denominator: float) -> float:
+    """Return numerator / denominator; a zero denominator gives inf (or 1.0 when both are zero)."""
+    if denominator == 0:
+        return float('inf') if numerator > 0 else 1.0
+    return numerator / denominator
+
+@dataclass(**DATACLASS_SLOTS)
 class TieredComparisonResult:
-    """Stores comparison results between two tiered strategy executions."""
+    """Stores comparison results between two tiered strategy executions.
+    
+    The ratio and difference fields are snapshots taken from the two metrics objects at
+    construction; they are not recomputed if those metrics are modified afterwards, and
+    equality compares only the migration ID and the metrics.
+    """
     migration_id: str
     exec1_metrics: TieredMigrationMetrics
     exec2_metrics: TieredMigrationMetrics
     
-    @property
-    def execution_time_ratio(self) -> float:
-        """Ratio of exec2 execution time to exec1 execution time."""
-        if self.exec1_metrics.total_execution_time == 0:
-            return float('inf') if self.exec2_metrics.total_execution_time > 0 else 1.0
-        return self.exec2_metrics.total_execution_time / self.exec1_metrics.total_execution_time
-    
-    @property
-    def execution_time_ratio_inverse(self) -> float:
-        """Ratio of exec1 execution time to exec2 execution time."""
-        if self.exec2_metrics.total_execution_time == 0:
-            return float('inf') if self.exec1_metrics.total_execution_time > 0 else 1.0
-        return self.exec1_metrics.total_execution_time / self.exec2_metrics.total_execution_time
-    
-    @property
-    def worker_count_ratio(self) -> float:
-        """Ratio of exec2 worker count to exec1 worker count."""
-        if self.exec1_metrics.total_workers == 0:
-            return float('inf') if self.exec2_metrics.total_workers > 0 else 1.0
-        return self.exec2_metrics.total_workers / self.exec1_metrics.total_workers
-    
-    @property
-    def worker_count_ratio_inverse(self) -> float:
-        """Ratio of exec1 worker count to exec2 worker count."""
-        if self.exec2_metrics.total_workers == 0:
-            return float('inf') if self.exec1_metrics.total_workers > 0 else 1.0
-        return self.exec1_metrics.total_workers / self.exec2_metrics.total_workers
-    
-    @property
-    def cpu_count_ratio(self) -> float:
-        """Ratio of exec2 CPU count to exec1 CPU count."""
-        if self.exec1_metrics.total_cpus == 0:
-            return float('inf') if self.exec2_metrics.total_cpus > 0 else 1.0
-        return self.exec2_metrics.total_cpus / self.exec1_metrics.total_cpus
-    
-    @property
-    def cpu_count_ratio_inverse(self) -> float:
-        """Ratio of exec1 CPU count to exec2 CPU count."""
-        if self.exec2_metrics.total_cpus == 0:
-            return float('inf') if self.exec1_metrics.total_cpus > 0 else 1.0
-        return self.exec1_metrics.total_cpus / self.exec2_metrics.total_cpus
-    
-    @property
-    def cpu_time_ratio(self) -> float:
-        """Ratio of exec2 CPU time to exec1 CPU time."""
-        if self.exec1_metrics.cpu_time == 0:
-            return float('inf') if self.exec2_metrics.cpu_time > 0 else 1.0
-        return self.exec2_metrics.cpu_time / self.exec1_metrics.cpu_time
-    
-    @property
-    def cpu_time_ratio_inverse(self) -> float:
-        """Ratio of exec1 CPU time to exec2 CPU time."""
-        if self.exec2_metrics.cpu_time == 0:
-            return float('inf') if self.exec1_metrics.cpu_time > 0 else 1.0
-        return self.exec1_metrics.cpu_time / self.exec2_metrics.cpu_time
-    
-    # Difference properties (exec2 - exec1)
-    @property
-    def execution_time_diff(self) -> float:
-        """Difference in execution time (exec2 - exec1)."""
-        return self.exec2_metrics.total_execution_time - self.exec1_metrics.total_execution_time
-    
-    @property
-    def worker_count_diff(self) -> int:
-        """Difference in worker count (exec2 - exec1)."""
-        return self.exec2_metrics.total_workers - self.exec1_metrics.total_workers
-    
-    @property
-    def cpu_count_diff(self) -> int:
-        """Difference in CPU count (exec2 - exec1)."""
-        return self.exec2_metrics.total_cpus - self.exec1_metrics.total_cpus
+    # Ratios (exec2/exec1, with *_inverse = exec1/exec2) and differences (exec2 - exec1),
+    # computed once in __post_init__ since every report reads them for every migration
+    execution_time_ratio: float = field(init=False, compare=False)
+    execution_time_ratio_inverse: float = field(init=False, compare=False)
+    worker_count_ratio: float = field(init=False, compare=False)
+    worker_count_ratio_inverse: float = field(init=False, compare=False)
+    cpu_count_ratio: float = field(init=False, compare=False)
+    cpu_count_ratio_inverse: float = field(init=False, compare=False)
+    cpu_time_ratio: float = field(init=False, compare=False)
+    cpu_time_ratio_inverse: float = field(init=False, compare=False)
+    execution_time_diff: float = field(init=False, compare=False)
+    worker_count_diff: int = field(init=False, compare=False)
+    cpu_count_diff: int = field(init=False, compare=False)
+    cpu_time_diff: float = field(init=False, compare=False)
+    data_size_diff: float = field(init=False, compare=False)
     
-    @property
-    def cpu_time_diff(self) -> float:
-        """Difference in CPU time (exec2 - exec1)."""
-        return self.exec2_metrics.cpu_time - self.exec1_metrics.cpu_time
-    
-    @property
-    def data_size_diff(self) -> float:
-        """Difference in data size (exec2 - exec1)."""
-        return self.exec2_metrics.total_data_size_gb - self.exec1_metrics.total_data_size_gb
+    def __post_init__(self):
+        exec1 = self.exec1_metrics
+        exec2 = self.exec2_metrics
+        self.execution_time_ratio = _safe_ratio(exec2.total_execution_time, exec1.total_execution_time)
+        self.execution_time_ratio_inverse = _safe_ratio(exec1.total_execution_time, exec2.total_execution_time)
+        self.worker_count_ratio = _safe_ratio(exec2.total_workers, exec1.total_workers)
+        self.worker_count_ratio_inverse = _safe_ratio(exec1.total_workers, exec2.total_workers)
+        self.cpu_count_ratio = _safe_ratio(exec2.total_cpus, exec1.total_cpus)
+        self.cpu_count_ratio_inverse = _safe_ratio(exec1.total_cpus, exec2.total_cpus)
+        self.cpu_time_ratio = _safe_ratio(exec2.cpu_time, exec1.cpu_time)
+        self.cpu_time_ratio_inverse = _safe_ratio(exec1.cpu_time, exec2.cpu_time)
+        self.execution_time_diff = exec2.total_execution_time - exec1.total_execution_time
+        self.worker_count_diff = exec2.total_workers - exec1.total_workers
+        self.cpu_count_diff = exec2.total_cpus - exec1.total_cpus
+        self.cpu_time_diff = exec2.cpu_time - exec1.cpu_time
+        self.data_size_diff = exec2.total_data_size_gb - exec1.total_data_size_gb
     
     def get_config_comparison(self, config_keys: List[str]) -> Dict[str, any]:
         """Compare specific configuration parameters between executions."""
@@ -144,26 +218,8 @@ class TieredComparisonResult:
     
     def _get_config_value(self, config: Dict[str, any], key: str):
         """Get a configuration value, looking in both simulation and migration sections."""
-        # Handle parameter name mapping from simulation config
-        simulation_mapping = {
-            'small_tier_worker_num_threads': 'small_threads',
-            'medium_tier_worker_num_threads': 'medium_threads',
-            'large_tier_worker_num_threads': 'large_threads'  # This is always 1
-        }
-        
-        # Migration parameters that should be looked up directly in migration config
-        migration_params = {
-            'small_tier_max_sstable_size_gb',
-            'small_tier_thread_subset_max_size_floor_gb',
-            'medium_tier_max_sstable_size_gb',
-            'medium_tier_thread_subset_max_size_floor_gb',
-            'optimize_packing_medium_subsets',
-            'skip_small_subsets',
-            'max_num_sstables_per_subset'
-        }
-        
         # First check if it's a migration parameter
-        if key in migration_params:
+        if key in MIGRATION_CONFIG_PARAMS:
             if 'migration' in config and key in config['migration']:
                 return config['migration'][key]
         
@@ -172,8 +228,8 @@ class TieredComparisonResult:
             return config['simulation'][key]
         
         # Try mapped lookup in simulation config
-        if key in simulation_mapping and 'simulation' in config:
-            mapped_key = simulation_mapping[key]
+        if key in SIMULATION_CONFIG_KEY_MAPPING and 'simulation' in config:
+            mapped_key = SIMULATION_CONFIG_KEY_MAPPING[key]
             if mapped_key in config['simulation']:
                 return config['simulation'][mapped_key]
         
@@ -184,6 +240,57 @@ class TieredComparisonResult:
         # Return None if not found
         return None
 
+@dataclass(**DATACLASS_SLOTS)
+class TieredAggregateTotals:
+    """Stores totals across all compared migrations for each execution."""
+    exec1_time: float = 0.0
+    exec2_time: float = 0.0
+    exec1_workers: int = 0
+    exec2_workers: int = 0
+    exec1_cpus: int = 0
+    exec2_cpus: int = 0
+    exec1_cpu_time: float = 0.0
+    exec2_cpu_time: float = 0.0
+    data_size_gb: float = 0.0  # exec1 data size (same data processed by both executions)
+
+@lru_cache(maxsize=64)
+def _read_execution_config(tiered_path: str) -> MappingProxyType:
+    """Parse the execution-level configuration of a run directory (cached, read-only).
+    
+    Entries are keyed by path only, so a run directory whose exec_reports change during
+    the process keeps returning the first parse; call _read_execution_config.cache_clear()
+    after regenerating a run to pick up the new report.
+    """
+    execution_config = {}
+    
+    # Look for execution report files that might contain configuration
+    exec_reports_dir = Path(tiered_path) / 'exec_reports'
+    if exec_reports_dir.exists():
+        # Look for execution report text files that contain migration configuration
+        for report_file in exec_reports_dir.glob('execution_report_*.txt'):
+            try:
+                with open(report_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    
+                # Parse "key: value" lines from the MIGRATION CONFIGURATION section(s) of the report
+                for section in MIGRATION_CONFIG_SECTION_RE.finditer(content):
+                    for key, value in CONFIG_LINE_RE.findall(section.group(1)):
+                        key = key.strip()
+                        value = value.strip()
+                        
+                        # Convert values to appropriate types
+                        if value.lower() in ['true', 'false']:
+                            execution_config[key] = value.lower() == 'true'
+                        elif NUMERIC_VALUE_RE.fullmatch(value):
+                            execution_config[key] = float(value) if '.' in value else int(value)
+                        else:
+                            execution_config[key] = value
+                break  # Use first report file found
+            except Exception as e:
+                print(f"Warning: Could not parse execution report {report_file}: {e}")
+    
+    return MappingProxyType(execution_config)
+
 class TieredSimulationDataExtractor:
     """Extracts metrics from tiered simulation output files."""
     
@@ -202,70 +309,33 @@ class TieredSimulationDataExtractor:
         
         metrics = {}
         
-        # Look for migration directories
-        for migration_dir in tiered_path.iterdir():
-            if migration_dir.is_dir() and migration_dir.name.startswith(('mig', 'migration')):
-                migration_id = migration_dir.name
-                if migration_id == 'exec_reports':
-                    continue
-                
-                # Extract metrics from JSON execution report
-                json_files = list(migration_dir.glob('migration_exec_results/*_execution_report.json'))
-                if json_files:
-                    migration_metrics = self._parse_tiered_json(migration_id, json_files[0], execution_name, execution_config)
-                    if migration_metrics:
-                        metrics[migration_id] = migration_metrics
+        # Look for migration directories and their JSON execution reports
+        # (one scandir per directory: entry types come from the listing instead of a stat per path)
+        with os.scandir(tiered_path) as entries:
+            migration_ids = [entry.name for entry in entries if entry.name.startswith(MIGRATION_DIR_PREFIXES) and entry.is_dir()]
+        for migration_id in migration_ids:
+            if migration_id == 'exec_reports':
+                continue
+            
+            # Only the first report is used, so stop at the first match
+            json_file = _first_entry_ending_with(tiered_path / migration_id / 'migration_exec_results', '_execution_report.json')
+            if json_file is not None:
+                migration_metrics = self._parse_tiered_json(migration_id, Path(json_file), execution_name, execution_config)
+                if migration_metrics:
+                    metrics[migration_id] = migration_metrics
         
         return metrics
     
     def _extract_execution_config(self, tiered_path: Path) -> Dict[str, any]:
         """Extract execution-level configuration from exec_reports directory."""
-        execution_config = {}
-        
-        # Look for execution report files that might contain configuration
-        exec_reports_dir = tiered_path / 'exec_reports'
-        if exec_reports_dir.exists():
-            # Look for execution report text files that contain migration configuration
-            for report_file in exec_reports_dir.glob('execution_report_*.txt'):
-                try:
-                    with open(report_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                    # Parse configuration from the report
-                    config_section = False
-                    for line in content.split('\n'):
-                        line = line.strip()
-                        if line.startswith('MIGRATION CONFIGURATION'):
-                            config_section = True
-                            continue
-                        elif line.startswith('SIMULATION CONFIGURATION') or line.startswith('PER-MIGRATION'):
-                            config_section = False
-                            continue
-                        
-                        if config_section and ':' in line and not line.startswith('-'):
-                            key, value = line.split(':', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            
-                            # Convert values to appropriate types
-                            if value.lower() in ['true', 'false']:
-                                execution_config[key] = value.lower() == 'true'
-                            elif value.replace('.', '').replace('-', '').isdigit():
-                                execution_config[key] = float(value) if '.' in value else int(value)
-                            else:
-                                execution_config[key] = value
-                    break  # Use first report file found
-                except Exception as e:
-                    print(f"Warning: Could not parse execution report {report_file}: {e}")
-        
-        return execution_config
+        # Parsed once per run directory; callers get their own mutable copy
+        return dict(_read_execution_config(str(tiered_path.resolve())))
     
     def _parse_tiered_json(self, migration_id: str, json_file: Path, execution_name: str, execution_config: Dict[str, any] = None) -> Optional[TieredMigrationMetrics]:
         """Parse tiered simulation JSON and CSV files to extract actual metrics."""
         try:
             # Parse JSON for basic metrics
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_report(json_file)
             
             total_execution_time = data.get('total_execution_time', 0.0)
             simulation_config = data.get('simulation_config', {})
@@ -286,7 +356,7 @@ class TieredSimulationDataExtractor:
             cpus_by_tier = {}
             stragglers_by_tier = {}
             
-            for tier in ['SMALL', 'MEDIUM', 'LARGE']:
+            for tier in TIERS:
                 if tier in by_tier:
                     tier_workers = by_tier[tier].get('total_workers', 0)
                     tier_stragglers = by_tier[tier].get('straggler_workers', 0)
@@ -296,8 +366,7 @@ class TieredSimulationDataExtractor:
                     
                     # Calculate CPUs for this tier
                     if tier_workers > 0:
-                        threads_per_worker = simulation_config.get(f'{tier.lower()}_threads', 1)
-                        tier_cpus = tier_workers * threads_per_worker
+                        tier_cpus = tier_workers * simulation_config.get(TIER_THREADS_KEYS[tier], 1)
                         total_cpus += tier_cpus
                         cpus_by_tier[tier] = tier_cpus
                     else:
@@ -317,24 +386,37 @@ class TieredSimulationDataExtractor:
             cpu_efficiency_values = []
             
             if workers_csv and workers_csv.exists():
-                with open(workers_csv, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        tier = row['Tier']
-                        duration = float(row['Duration'])
-                        threads_per_worker = simulation_config.get(f'{tier.lower()}_threads', 1)
-                        cpu_time += duration * threads_per_worker
-                        
-                        # Extract data size from CSV (with safety check)
-                        if 'Data_Size_GB' in row and row['Data_Size_GB']:
-                            total_data_size_gb += float(row['Data_Size_GB'])
-                        
-                        # Extract efficiency metrics if available (new CSV format)
-                        if 'Total_Used_CPU_Time' in row and 'Total_Active_CPU_Time' in row:
-                            total_used_cpu_time += float(row['Total_Used_CPU_Time'])
-                            total_active_cpu_time += float(row['Total_Active_CPU_Time'])
-                            cpu_inefficiency += float(row['CPU_Inefficiency'])
-                            cpu_efficiency_values.append(float(row['CPU_Efficiency_Percent']))
+                with open(workers_csv, 'r', encoding='utf-8', newline='') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None) or []
+                    rows = [row for row in reader if row]
+                
+                # Reduce each needed column in one pass instead of accumulating field by field per row
+                if rows:
+                    column_index = {name: i for i, name in enumerate(header)}
+                    tier_col = column_index['Tier']
+                    duration_col = column_index['Duration']
+                    # Threads per worker for each distinct tier value, looked up once rather than per row
+                    # (TIER_THREADS_KEYS covers the known tiers; other tier names fall back to the same key pattern)
+                    tier_threads = {tier: simulation_config.get(TIER_THREADS_KEYS.get(tier) or f'{tier.lower()}_threads', 1)
+                                    for tier in {row[tier_col] for row in rows}}
+                    cpu_time = sum(float(row[duration_col]) * tier_threads[row[tier_col]] for row in rows)
+                    
+                    # Extract data size from CSV (with safety check)
+                    if 'Data_Size_GB' in column_index:
+                        data_size_col = column_index['Data_Size_GB']
+                        total_data_size_gb = sum(float(row[data_size_col]) for row in rows if row[data_size_col])
+                    
+                    # Extract efficiency metrics if available (new CSV format)
+                    if 'Total_Used_CPU_Time' in column_index and 'Total_Active_CPU_Time' in column_index:
+                        used_col = column_index['Total_Used_CPU_Time']
+                        active_col = column_index['Total_Active_CPU_Time']
+                        inefficiency_col = column_index['CPU_Inefficiency']
+                        efficiency_col = column_index['CPU_Efficiency_Percent']
+                        total_used_cpu_time = sum(float(row[used_col]) for row in rows)
+                        total_active_cpu_time = sum(float(row[active_col]) for row in rows)
+                        cpu_inefficiency = sum(float(row[inefficiency_col]) for row in rows)
+                        cpu_efficiency_values = [float(row[efficiency_col]) for row in rows]
             else:
                 # Fallback to conservative estimate if CSV not available
                 cpu_time = total_execution_time * total_cpus if total_cpus > 0 else total_execution_time
@@ -380,6 +462,232 @@ class TieredSimulationDataExtractor:
             print(f"Error parsing tiered data for {migration_id}: {e}")
             return None
 
+def _csv_field(value: str) -> str:
+    """Quote a CSV string field only when needed, matching csv.writer's QUOTE_MINIMAL."""
+    if ',' in value or '"' in value or '\r' in value or '\n' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def _format_worker_text(workers: int, stragglers: int) -> str:
+    """Format a worker count for the text report, appending stragglers as "total[stragglers]"."""
+    if workers == 0:
+        return "0"
+    elif stragglers > 0:
+        return f"{workers}[{stragglers}]"
+    else:
+        return str(workers)
+
+def _format_worker_cell(workers: int, stragglers: int) -> Tuple[str, str]:
+    """Format a tier worker count for the HTML report, returning (cell text, CSS class suffix)."""
+    if workers == 0:
+        return ('0', '')
+    elif stragglers > 0:
+        return (f'{workers:,}[{stragglers}]', ' has-stragglers')
+    else:
+        return (f'{workers:,}', '')
+
+def _sum_by_tier(tier_counts: List[Dict[str, int]]) -> Dict[str, int]:
+    """Total per-tier counts across migrations, laid out as fixed (SMALL, MEDIUM, LARGE) rows and summed column-wise."""
+    rows = [[counts.get(tier, 0) for tier in TIERS] for counts in tier_counts]
+    if not rows:
+        return dict.fromkeys(TIERS, 0)
+    return dict(zip(TIERS, map(sum, zip(*rows))))
+
+# Static page head, styles and title block of the HTML report; only the timestamp varies
+HTML_HEADER_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Tiered vs Tiered Migration Comparison</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #fafafa; }}
+        h1, h2 {{ color: #333; }}
+        .header {{ background-color: #e8f5e8; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
+        .config {{ background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+        .summary {{ background-color: #e8f4f8; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+        .aggregate {{ background-color: #fff3e0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+        .config-comparison {{ background-color: #f0f8ff; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+        .config-same {{ background-color: #e8f5e8 !important; }}
+        .config-different {{ background-color: #ffe8e8 !important; }}
+        .has-stragglers {{ background-color: #ffcccc !important; }} /* Light red for cells with stragglers */
+        .large-migration {{ background-color: #ffe4b5 !important; border-left: 4px solid #ff8c00 !important; }}
+        .low-efficiency {{ background-color: #ffff00 !important; font-weight: bold; }} /* Bright yellow for low efficiency migrations */
+        .best-efficiency {{ background-color: #c8e6c9 !important; font-weight: bold; }} /* Light green for best efficiency */
+        
+        table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; background-color: white; }}
+        th, td {{ border: 1px solid #ddd; padding: 10px; text-align: left; }}
+        th {{ background-color: #f2f2f2; font-weight: bold; }}
+        tr:nth-child(even) {{ background-color: #f9f9f9; }}
+        tr:hover {{ background-color: #f0f0f0; }}
+        
+        /* Thicker borders for metric group separators */
+        .group-separator-left {{ border-left: 3px solid #333 !important; }}
+        .group-separator-right {{ border-right: 3px solid #333 !important; }}
+        
+        .migration-details {{ margin-top: 20px; }}
+        .best-time {{ background-color: #c8e6c9 !important; font-weight: bold; }}
+        .best-ratio {{ background-color: #c8e6c9 !important; font-weight: bold; }}
+        .positive-diff {{ background-color: #add8e6 !important; }} /* Light blue for positive differences */
+        .negative-diff {{ background-color: #fff8dc !important; }} /* Light yellow for negative differences */
+        
+        .metric-section {{ margin-bottom: 30px; }}
+        .exclusive-migrations {{ background-color: #fff8e1; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
+        
+        .ratio-header {{ font-size: 0.9em; }}
+        .number {{ text-align: right; }}
+    </style>
+</head>
+<body>
+<div class="header">
+    <h1>Tiered vs Tiered Migration Simulation Comparison</h1>
+    <p><strong>Generated:</strong> {timestamp}</p>
+</div>
+
+<div class="config">
+    <h2>Comparison Details</h2>"""
+
+# CSS class suffix of a signed diff cell, indexed by the sign of the diff (0, +1, -1).
+# Like every optional HTML row class it carries its own leading space, so empty slots add no whitespace.
+DIFF_CLASSES = ("", " positive-diff", " negative-diff")
+
+# (exec1, exec2) CSS classes of a lower-is-better metric pair, indexed by the sign of exec1 - exec2 (0, +1, -1)
+BEST_VALUE_CLASSES = (("", ""), ("", " best-time"), (" best-time", ""))
+
+# Per-migration row of the text report table, rendered with str.format() in column order
+TEXT_ROW_TEMPLATE = "{:<12} {:<8.1f} {:<10} {:<10} {:<8} {:<8} {:<8} {:<+6d} {:<8} {:<8} {:<+6d} {:<10} {:<10} {:<8}"
+
+# Per-migration row of the HTML report table, rendered with str.format_map()
+HTML_ROW_TEMPLATE = """
+            <tr>
+                <td class="{migration_id_class}"><strong>{migration_id}</strong></td>
+                <td class="number{data_size_class}">{data_size_gb:.1f}</td>
+                <td class="number group-separator-left{exec1_time_class}">{exec1_time}</td>
+                <td class="number{exec2_time_class}">{exec2_time}</td>
+                <td class="number{exec_time_diff_class}">{exec_time_diff}</td>
+                <td class="number group-separator-left{exec1_workers_class}">{exec1_workers:,}</td>
+                <td class="number{exec2_workers_class}">{exec2_workers:,}</td>
+                <td class="number{worker_diff_class}">{worker_diff:+d}</td>
+                <td class="number group-separator-left">{exec1_cpus:,}</td>
+                <td class="number">{exec2_cpus:,}</td>
+                <td class="number{cpu_diff_class}">{cpu_diff:+d}</td>
+                <td class="number group-separator-left{exec1_cpu_time_class}">{exec1_cpu_time}</td>
+                <td class="number{exec2_cpu_time_class}">{exec2_cpu_time}</td>
+                <td class="number{cpu_time_diff_class}">{cpu_time_diff}</td>
+                <td class="number group-separator-left{exec1_efficiency_class}">{exec1_active_cpu_time:.1f}s</td>
+                <td class="number{exec1_efficiency_percent_class}">{exec1_efficiency_percent:.1f}%</td>
+                <td class="number{exec1_efficiency_class}">{exec1_inefficiency_percent:.1f}%</td>
+                <td class="number group-separator-left{exec2_efficiency_class}">{exec2_active_cpu_time:.1f}s</td>
+                <td class="number{exec2_efficiency_percent_class}">{exec2_efficiency_percent:.1f}%</td>
+                <td class="number{exec2_efficiency_class}">{exec2_inefficiency_percent:.1f}%</td>
+                <td class="number group-separator-left{exec1_small_w_class}">{exec1_small_w}</td>
+                <td class="number{exec1_medium_w_class}">{exec1_medium_w}</td>
+                <td class="number{exec1_large_w_class}">{exec1_large_w}</td>
+                <td class="number">{exec1_small_c:,}</td>
+                <td class="number">{exec1_medium_c:,}</td>
+                <td class="number">{exec1_large_c:,}</td>
+                <td class="number group-separator-left{exec2_small_w_class}">{exec2_small_w}</td>
+                <td class="number{exec2_medium_w_class}">{exec2_medium_w}</td>
+                <td class="number{exec2_large_w_class}">{exec2_large_w}</td>
+                <td class="number">{exec2_small_c:,}</td>
+                <td class="number">{exec2_medium_c:,}</td>
+                <td class="number">{exec2_large_c:,}</td>
+            </tr>"""
+
+# Static column headers of the per-migration HTML table, up to the opening <tbody>
+HTML_TABLE_HEADER = """
+    <table>
+        <thead>
+            <tr>
+                <th rowspan="2">Migration ID</th>
+                <th rowspan="2">Data Size (GB)</th>
+                <th colspan="3" class="group-separator-left">Execution Time</th>
+                <th colspan="3" class="group-separator-left">Workers</th>
+                <th colspan="3" class="group-separator-left">CPUs</th>
+                <th colspan="3" class="group-separator-left">CPU Time</th>
+                <th colspan="3" class="group-separator-left">CPU Efficiency (Exec1)</th>
+                <th colspan="3" class="group-separator-left">CPU Efficiency (Exec2)</th>
+                <th colspan="6" class="group-separator-left">Exec1 Tier Distribution</th>
+                <th colspan="6" class="group-separator-left">Exec2 Tier Distribution</th>
+            </tr>
+            <tr>
+                <th class="group-separator-left">Exec1</th>
+                <th>Exec2</th>
+                <th class="diff-header">Ex2 - Ex1</th>
+                <th class="group-separator-left">Exec1</th>
+                <th>Exec2</th>
+                <th class="diff-header">Ex2 - Ex1</th>
+                <th class="group-separator-left">Exec1</th>
+                <th>Exec2</th>
+                <th class="diff-header">Ex2 - Ex1</th>
+                <th class="group-separator-left">Exec1</th>
+                <th>Exec2</th>
+                <th class="diff-header">Ex2 - Ex1</th>
+                <th class="group-separator-left">Active Time</th>
+                <th>Eff %</th>
+                <th>Waste %</th>
+                <th class="group-separator-left">Active Time</th>
+                <th>Eff %</th>
+                <th>Waste %</th>
+                <th class="group-separator-left">Small W</th>
+                <th>Med W</th>
+                <th>Large W</th>
+                <th>Small C</th>
+                <th>Med C</th>
+                <th>Large C</th>
+                <th class="group-separator-left">Small W</th>
+                <th>Med W</th>
+                <th>Large W</th>
+                <th>Small C</th>
+                <th>Med C</th>
+                <th>Large C</th>
+            </tr>
+        </thead>
+        <tbody>"""
+
+# Closing of the per-migration HTML table, the static legend and the end of the document
+HTML_FOOTER = """
+        </tbody>
+    </table>
+</div>
+
+<div class="aggregate">
+    <h2>Legend</h2>
+    <p><span style="background-color: #c8e6c9; padding: 2px 6px; border-radius: 3px;">Green highlighting</span> indicates the best (lowest) execution time, CPU time, worker count, and best CPU efficiency for each migration.</p>
+    <p><strong>Column Abbreviations:</strong></p>
+    <ul>
+        <li><strong>W:</strong> Workers (number of workers allocated to each tier)</li>
+        <li><strong>C:</strong> CPUs/Cores (total threads allocated to each tier = workers × threads per worker)</li>
+    </ul>
+    <p><strong>CPU Efficiency Highlighting:</strong></p>
+    <ul>
+        <li><span style="background-color: #c8e6c9; padding: 2px 6px; border-radius: 3px; font-weight: bold;">Light green</span> indicates the execution with better CPU efficiency percentage for each migration</li>
+        <li><span style="background-color: #ffff00; padding: 2px 6px; border-radius: 3px; font-weight: bold;">Yellow highlighting</span> takes priority and indicates low efficiency percentage (below threshold) in the "Eff %" columns only</li>
+    </ul>
+    <p><strong>Straggler Information:</strong></p>
+    <ul>
+        <li><strong>Format:</strong> Total workers shown as "total[stragglers]" (e.g., "15[3]" = 15 workers, 3 stragglers)</li>
+        <li><span style="background-color: #ffcccc; padding: 2px 6px; border-radius: 3px;">Light red background</span> indicates cells with straggler workers</li>
+    </ul>
+    <p><strong>Difference Interpretation (Exec2 - Exec1):</strong></p>
+    <ul>
+        <li><span style="background-color: #add8e6; padding: 2px 6px; border-radius: 3px;">Light blue</span> indicates positive differences (Exec2 > Exec1)</li>
+        <li><span style="background-color: #fff8dc; padding: 2px 6px; border-radius: 3px;">Light yellow</span> indicates negative differences (Exec2 < Exec1)</li>
+        <li><strong>Positive execution time difference:</strong> Exec2 took longer</li>
+        <li><strong>Negative execution time difference:</strong> Exec2 was faster</li>
+    </ul>
+</div>
+
+</body>
+</html>"""
+
+# Closing of the HTML config comparison table and its legend
+HTML_CONFIG_TABLE_FOOTER = """
+            </tbody>
+        </table>
+        <p><strong>Legend:</strong> 
+            <span style="background-color: #e8f5e8; padding: 2px 6px; border-radius: 3px;">Green</span> = Same configuration, 
+            <span style="background-color: #ffe8e8; padding: 2px 6px; border-radius: 3px;">Light red</span> = Different configuration
+        </p>"""
+
 class TieredComparisonAnalyzer:
     """Analyzes and compares tiered simulation results."""
     
@@ -407,15 +715,17 @@ class TieredComparisonAnalyzer:
         exec1_only_migrations = exec1_migrations - exec2_migrations
         exec2_only_migrations = exec2_migrations - exec1_migrations
         
-        print(f"Common migrations: {sorted(common_migrations)}")
+        # Sorted once for both the log line and the comparison order
+        common_migration_ids = sorted(common_migrations)
+        print(f"Common migrations: {common_migration_ids}")
         
-        if not common_migrations:
+        if not common_migration_ids:
             print("Warning: No common migrations found between the two runs")
             return [], exec1_only_migrations, exec2_only_migrations
         
         # Create comparison results
         comparisons = []
-        for migration_id in sorted(common_migrations):
+        for migration_id in common_migration_ids:
             comparison = TieredComparisonResult(
                 migration_id=migration_id,
                 exec1_metrics=exec1_metrics[migration_id],
@@ -464,19 +774,21 @@ class TieredComparisonAnalyzer:
         print(f"{'ID':<12} {'Size':<8} {exec1_short:<10} {exec2_short:<10} {'2/1':<5} {'1/2':<5} {exec1_short:<8} {exec2_short:<8} {'2/1':<5} {'1/2':<5} {exec1_short:<8} {exec2_short:<8} {'2/1':<5} {'1/2':<5} {exec1_short:<10} {exec2_short:<10} {'2/1':<5} {'1/2':<5}")
         print(f"{'':12} {'(GB)':<8} {'-'*35} {'-'*30} {'-'*30} {'-'*35}")
         
-        # Data rows
+        # Data rows, collected and written to stdout in one go
+        rows = []
+        format_time = self._format_time
         for comp in comparisons:
             exec1 = comp.exec1_metrics
             exec2 = comp.exec2_metrics
             
             # Format large numbers
-            exec1_time = self._format_time(exec1.total_execution_time)
-            exec2_time = self._format_time(exec2.total_execution_time)
+            exec1_time = format_time(exec1.total_execution_time)
+            exec2_time = format_time(exec2.total_execution_time)
             time_ratio_21 = f"{comp.execution_time_ratio:.2f}"
             time_ratio_12 = f"{comp.execution_time_ratio_inverse:.2f}"
             
-            exec1_cpu_time = self._format_time(exec1.cpu_time)
-            exec2_cpu_time = self._format_time(exec2.cpu_time)
+            exec1_cpu_time = format_time(exec1.cpu_time)
+            exec2_cpu_time = format_time(exec2.cpu_time)
             cpu_time_ratio_21 = f"{comp.cpu_time_ratio:.2f}"
             cpu_time_ratio_12 = f"{comp.cpu_time_ratio_inverse:.2f}"
             
@@ -489,27 +801,29 @@ class TieredComparisonAnalyzer:
             # Data size (should be same for both executions)
             data_size_str = f"{exec1.total_data_size_gb:.1f}"
             
-            print(f"{comp.migration_id:<12} {data_size_str:<8} {exec1_time:<10} {exec2_time:<10} {time_ratio_21:<5} {time_ratio_12:<5} "
-                  f"{exec1.total_workers:<8} {exec2.total_workers:<8} {worker_ratio_21:<5} {worker_ratio_12:<5} "
-                  f"{exec1.total_cpus:<8} {exec2.total_cpus:<8} {cpu_ratio_21:<5} {cpu_ratio_12:<5} "
-                  f"{exec1_cpu_time:<10} {exec2_cpu_time:<10} {cpu_time_ratio_21:<5} {cpu_time_ratio_12:<5}")
+            rows.append(f"{comp.migration_id:<12} {data_size_str:<8} {exec1_time:<10} {exec2_time:<10} {time_ratio_21:<5} {time_ratio_12:<5} "
+                        f"{exec1.total_workers:<8} {exec2.total_workers:<8} {worker_ratio_21:<5} {worker_ratio_12:<5} "
+                        f"{exec1.total_cpus:<8} {exec2.total_cpus:<8} {cpu_ratio_21:<5} {cpu_ratio_12:<5} "
+                        f"{exec1_cpu_time:<10} {exec2_cpu_time:<10} {cpu_time_ratio_21:<5} {cpu_time_ratio_12:<5}\n")
+        sys.stdout.write("".join(rows))
         
         # Summary statistics
         print("\n" + "="*125)
         print("AGGREGATE ANALYSIS")
         print("="*125)
         
-        total_exec1_time = sum(c.exec1_metrics.total_execution_time for c in comparisons)
-        total_exec2_time = sum(c.exec2_metrics.total_execution_time for c in comparisons)
+        totals = self._compute_aggregate_totals(comparisons)
+        total_exec1_time = totals.exec1_time
+        total_exec2_time = totals.exec2_time
         
-        total_exec1_workers = sum(c.exec1_metrics.total_workers for c in comparisons)
-        total_exec2_workers = sum(c.exec2_metrics.total_workers for c in comparisons)
+        total_exec1_workers = totals.exec1_workers
+        total_exec2_workers = totals.exec2_workers
         
-        total_exec1_cpus = sum(c.exec1_metrics.total_cpus for c in comparisons)
-        total_exec2_cpus = sum(c.exec2_metrics.total_cpus for c in comparisons)
+        total_exec1_cpus = totals.exec1_cpus
+        total_exec2_cpus = totals.exec2_cpus
         
-        total_exec1_cpu_time = sum(c.exec1_metrics.cpu_time for c in comparisons)
-        total_exec2_cpu_time = sum(c.exec2_metrics.cpu_time for c in comparisons)
+        total_exec1_cpu_time = totals.exec1_cpu_time
+        total_exec2_cpu_time = totals.exec2_cpu_time
         
         print("")
         print("Total Execution Time:")
@@ -552,23 +866,16 @@ class TieredComparisonAnalyzer:
         print("="*125)
         
         # Calculate tier totals
-        tier_totals_exec1 = {'SMALL': 0, 'MEDIUM': 0, 'LARGE': 0}
-        tier_totals_exec2 = {'SMALL': 0, 'MEDIUM': 0, 'LARGE': 0}
-        tier_cpu_totals_exec1 = {'SMALL': 0, 'MEDIUM': 0, 'LARGE': 0}
-        tier_cpu_totals_exec2 = {'SMALL': 0, 'MEDIUM': 0, 'LARGE': 0}
-        
-        for comp in comparisons:
-            for tier in ['SMALL', 'MEDIUM', 'LARGE']:
-                tier_totals_exec1[tier] += comp.exec1_metrics.workers_by_tier.get(tier, 0)
-                tier_totals_exec2[tier] += comp.exec2_metrics.workers_by_tier.get(tier, 0)
-                tier_cpu_totals_exec1[tier] += comp.exec1_metrics.cpus_by_tier.get(tier, 0)
-                tier_cpu_totals_exec2[tier] += comp.exec2_metrics.cpus_by_tier.get(tier, 0)
+        tier_totals_exec1 = _sum_by_tier([comp.exec1_metrics.workers_by_tier for comp in comparisons])
+        tier_totals_exec2 = _sum_by_tier([comp.exec2_metrics.workers_by_tier for comp in comparisons])
+        tier_cpu_totals_exec1 = _sum_by_tier([comp.exec1_metrics.cpus_by_tier for comp in comparisons])
+        tier_cpu_totals_exec2 = _sum_by_tier([comp.exec2_metrics.cpus_by_tier for comp in comparisons])
         
         print(f"\n{'Tier':<8} {'Workers':<25} {'CPUs':<25}")
         print(f"{'Name':<8} {'Exec1':<8} {'Exec2':<8} {'Ratio':<8} {'Exec1':<8} {'Exec2':<8} {'Ratio':<8}")
         print("-" * 65)
         
-        for tier in ['SMALL', 'MEDIUM', 'LARGE']:
+        for tier in TIERS:
             exec1_workers = tier_totals_exec1[tier]
             exec2_workers = tier_totals_exec2[tier]
             exec1_cpus = tier_cpu_totals_exec1[tier]
@@ -579,8 +886,44 @@ class TieredComparisonAnalyzer:
             
             print(f"{tier:<8} {exec1_workers:<8} {exec2_workers:<8} {worker_ratio:<8} {exec1_cpus:<8} {exec2_cpus:<8} {cpu_ratio:<8}")
     
-    def _format_time(self, time_units: float) -> str:
-        """Format time values for readable display."""
+    def compare_configs(self, comparisons: List[TieredComparisonResult]) -> Dict[str, any]:
+        """Compare the CONFIG_COMPARISON_KEYS settings of both executions.
+        
+        The configuration is shared by every migration of an execution, so it is read from the
+        first comparison. main() computes it once per run and passes it to all three report
+        writers; a writer called without it computes its own.
+        """
+        if not comparisons:
+            return {}
+        return comparisons[0].get_config_comparison(CONFIG_COMPARISON_KEYS)
+    
+    def _compute_aggregate_totals(self, comparisons: List[TieredComparisonResult]) -> TieredAggregateTotals:
+        """Sum per-execution totals over all comparisons column by column."""
+        if not comparisons:
+            return TieredAggregateTotals()
+        
+        # Transpose the per-migration metric tuples into columns and let sum() reduce each one in C
+        exec1_time, exec1_workers, exec1_cpus, exec1_cpu_time, data_size_gb = map(
+            sum, zip(*map(AGGREGATE_METRIC_FIELDS, map(attrgetter('exec1_metrics'), comparisons))))
+        exec2_time, exec2_workers, exec2_cpus, exec2_cpu_time, _ = map(
+            sum, zip(*map(AGGREGATE_METRIC_FIELDS, map(attrgetter('exec2_metrics'), comparisons))))
+        
+        return TieredAggregateTotals(
+            exec1_time=exec1_time,
+            exec2_time=exec2_time,
+            exec1_workers=exec1_workers,
+            exec2_workers=exec2_workers,
+            exec1_cpus=exec1_cpus,
+            exec2_cpus=exec2_cpus,
+            exec1_cpu_time=exec1_cpu_time,
+            exec2_cpu_time=exec2_cpu_time,
+            data_size_gb=data_size_gb
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_time(time_units: float) -> str:
+        """Format time values for readable display (memoized: totals and diffs repeat across report sections)."""
         if time_units >= 1000000000:  # billions
             return f"{time_units/1000000000:.1f}B"
         elif time_units >= 1000000:  # millions
@@ -590,146 +933,151 @@ class TieredComparisonAnalyzer:
         else:
             return f"{time_units:.1f}"
     
-    def save_comparison_csv(self, comparisons: List[TieredComparisonResult], output_file: str, exec1_name: str = None, exec2_name: str = None, data_size_threshold: float = None, efficiency_threshold: float = None):
+    @classmethod
+    @lru_cache(maxsize=8192)
+    def _format_signed_time(cls, diff: float, signed_zero: bool = False) -> str:
+        """Format a time difference with an explicit sign; zero gets a "+" only when signed_zero is set."""
+        if diff > 0 or (signed_zero and diff == 0):
+            return f"+{cls._format_time(diff)}"
+        elif diff < 0:
+            return f"-{cls._format_time(-diff)}"
+        else:
+            return cls._format_time(abs(diff))
+    
+    def save_comparison_csv(self, comparisons: List[TieredComparisonResult], output_file: str, exec1_name: str = None, exec2_name: str = None, data_size_threshold: float = None, efficiency_threshold: float = None, config_comparison: Dict[str, any] = None):
         """Save comparison results to CSV file."""
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            # Write header comments
-            csvfile.write("# Tiered vs Tiered Migration Simulation Comparison\n")
-            csvfile.write(f"# Execution 1: {exec1_name or 'Unknown'}\n")
-            csvfile.write(f"# Execution 2: {exec2_name or 'Unknown'}\n")
-            csvfile.write(f"# Common Migrations: {len(comparisons)}\n")
+        # Build the header comment block up front so it goes out in a single write
+        header_lines = [
+            "# Tiered vs Tiered Migration Simulation Comparison",
+            f"# Execution 1: {exec1_name or 'Unknown'}",
+            f"# Execution 2: {exec2_name or 'Unknown'}",
+            f"# Common Migrations: {len(comparisons)}",
+        ]
+        
+        # Threshold flag columns ('Yes'/'No' per row), evaluated once and reused for the header counts
+        flag_columns = []
+        
+        # Data size threshold information
+        if data_size_threshold is not None:
+            large_flags = ['Yes' if comp.exec1_metrics.total_data_size_gb >= data_size_threshold else 'No' for comp in comparisons]
+            flag_columns.append(large_flags)
+            header_lines.append(f"# Large Migrations: {large_flags.count('Yes')} (>= {data_size_threshold} GB)")
             
-            # Data size threshold information
-            if data_size_threshold is not None:
-                large_migrations = [comp for comp in comparisons if comp.exec1_metrics.total_data_size_gb >= data_size_threshold]
-                csvfile.write(f"# Large Migrations: {len(large_migrations)} (>= {data_size_threshold} GB)\n")
-                
-            # Efficiency threshold information
-            if efficiency_threshold is not None:
-                low_efficiency_exec1 = sum(1 for comp in comparisons if comp.exec1_metrics.average_cpu_efficiency_percent > 0 and comp.exec1_metrics.average_cpu_efficiency_percent < efficiency_threshold)
-                low_efficiency_exec2 = sum(1 for comp in comparisons if comp.exec2_metrics.average_cpu_efficiency_percent > 0 and comp.exec2_metrics.average_cpu_efficiency_percent < efficiency_threshold)
-                csvfile.write(f"# Low Efficiency Threshold: {efficiency_threshold:.1f}% (Exec1: {low_efficiency_exec1}, Exec2: {low_efficiency_exec2} migrations)\n")
-                
-            csvfile.write("# Diff columns show Exec2 - Exec1 (positive = Exec2 higher, negative = Exec2 lower)\n")
-            csvfile.write("# Data size is the same for both executions (same data processed)\n")
-            csvfile.write("#\n")
+        # Efficiency threshold information
+        if efficiency_threshold is not None:
+            low_efficiency_flags_exec1 = ['Yes' if 0 < comp.exec1_metrics.average_cpu_efficiency_percent < efficiency_threshold else 'No' for comp in comparisons]
+            low_efficiency_flags_exec2 = ['Yes' if 0 < comp.exec2_metrics.average_cpu_efficiency_percent < efficiency_threshold else 'No' for comp in comparisons]
+            flag_columns.extend([low_efficiency_flags_exec1, low_efficiency_flags_exec2])
+            header_lines.append(f"# Low Efficiency Threshold: {efficiency_threshold:.1f}% (Exec1: {low_efficiency_flags_exec1.count('Yes')}, Exec2: {low_efficiency_flags_exec2.count('Yes')} migrations)")
             
-            # Write configuration comparison
-            if comparisons:
-                csvfile.write("# CONFIGURATION COMPARISON\n")
-                config_keys = [
-                    'small_tier_max_sstable_size_gb',
-                    'small_tier_thread_subset_max_size_floor_gb', 
-                    'small_tier_worker_num_threads',
-                    'medium_tier_max_sstable_size_gb',
-                    'medium_tier_worker_num_threads',
-                    'optimize_packing_medium_subsets',
-                    'execution_mode',
-                    'max_concurrent_workers'
-                ]
-                first_comp = comparisons[0]
-                config_comparison = first_comp.get_config_comparison(config_keys)
-                
-                for key, comparison in config_comparison.items():
-                    exec1_value = comparison['exec1'] if comparison['exec1'] is not None else 'N/A'
-                    exec2_value = comparison['exec2'] if comparison['exec2'] is not None else 'N/A'
-                    status = 'Same' if comparison['same'] else 'Different'
-                    csvfile.write(f"# {key}: {exec1_value} vs {exec2_value} ({status})\n")
+        header_lines.append("# Diff columns show Exec2 - Exec1 (positive = Exec2 higher, negative = Exec2 lower)")
+        header_lines.append("# Data size is the same for both executions (same data processed)")
+        header_lines.append("#")
+        
+        # Write configuration comparison
+        if comparisons:
+            header_lines.append("# CONFIGURATION COMPARISON")
+            if config_comparison is None:
+                config_comparison = self.compare_configs(comparisons)
             
-            csvfile.write("\n")
+            # The CSV header lists a subset of the keys shared with the text and HTML reports
+            for key in CSV_CONFIG_COMPARISON_KEYS:
+                comparison = config_comparison[key]
+                exec1_value = comparison['exec1'] if comparison['exec1'] is not None else 'N/A'
+                exec2_value = comparison['exec2'] if comparison['exec2'] is not None else 'N/A'
+                status = 'Same' if comparison['same'] else 'Different'
+                header_lines.append(f"# {key}: {exec1_value} vs {exec2_value} ({status})")
+        
+        header_lines.append("")
+        
+        # CSV header
+        fieldnames = [
+            'Migration_ID', 'Data_Size_GB',
+            'Exec1_Execution_Time', 'Exec2_Execution_Time', 'Execution_Time_Ex2_minus_Ex1',
+            'Exec1_Workers', 'Exec2_Workers', 'Worker_Ex2_minus_Ex1',
+            'Exec1_CPUs', 'Exec2_CPUs', 'CPU_Ex2_minus_Ex1',
+            'Exec1_CPU_Time', 'Exec2_CPU_Time', 'CPU_Time_Ex2_minus_Ex1',
+            'Exec1_CPU_Active_Time', 'Exec1_CPU_Efficiency_Percent', 'Exec1_CPU_Waste_Percent',
+            'Exec2_CPU_Active_Time', 'Exec2_CPU_Efficiency_Percent', 'Exec2_CPU_Waste_Percent',
+            'Exec1_Small_Workers', 'Exec1_Medium_Workers', 'Exec1_Large_Workers',
+            'Exec1_Small_Stragglers', 'Exec1_Medium_Stragglers', 'Exec1_Large_Stragglers',
+            'Exec1_Small_CPUs', 'Exec1_Medium_CPUs', 'Exec1_Large_CPUs',
+            'Exec2_Small_Workers', 'Exec2_Medium_Workers', 'Exec2_Large_Workers',
+            'Exec2_Small_Stragglers', 'Exec2_Medium_Stragglers', 'Exec2_Large_Stragglers',
+            'Exec2_Small_CPUs', 'Exec2_Medium_CPUs', 'Exec2_Large_CPUs'
+        ]
+        
+        # Add Is_Large_Migration column if threshold is specified
+        if data_size_threshold is not None:
+            fieldnames.append('Is_Large_Migration')
             
-            # CSV header
-            fieldnames = [
-                'Migration_ID', 'Data_Size_GB',
-                'Exec1_Execution_Time', 'Exec2_Execution_Time', 'Execution_Time_Ex2_minus_Ex1',
-                'Exec1_Workers', 'Exec2_Workers', 'Worker_Ex2_minus_Ex1',
-                'Exec1_CPUs', 'Exec2_CPUs', 'CPU_Ex2_minus_Ex1',
-                'Exec1_CPU_Time', 'Exec2_CPU_Time', 'CPU_Time_Ex2_minus_Ex1',
-                'Exec1_CPU_Active_Time', 'Exec1_CPU_Efficiency_Percent', 'Exec1_CPU_Waste_Percent',
-                'Exec2_CPU_Active_Time', 'Exec2_CPU_Efficiency_Percent', 'Exec2_CPU_Waste_Percent',
-                'Exec1_Small_Workers', 'Exec1_Medium_Workers', 'Exec1_Large_Workers',
-                'Exec1_Small_Stragglers', 'Exec1_Medium_Stragglers', 'Exec1_Large_Stragglers',
-                'Exec1_Small_CPUs', 'Exec1_Medium_CPUs', 'Exec1_Large_CPUs',
-                'Exec2_Small_Workers', 'Exec2_Medium_Workers', 'Exec2_Large_Workers',
-                'Exec2_Small_Stragglers', 'Exec2_Medium_Stragglers', 'Exec2_Large_Stragglers',
-                'Exec2_Small_CPUs', 'Exec2_Medium_CPUs', 'Exec2_Large_CPUs'
-            ]
+        # Add efficiency flag columns if threshold is specified
+        if efficiency_threshold is not None:
+            fieldnames.extend(['Exec1_Is_Low_Efficiency', 'Exec2_Is_Low_Efficiency'])
+        
+        # Every column has a fixed type, so each data row is emitted with a single %-format call
+        row_format = CSV_ROW_FORMAT
+        if data_size_threshold is not None:
+            row_format += ",%s"
+        if efficiency_threshold is not None:
+            row_format += ",%s,%s"
+        row_format += CSV_LINE_TERMINATOR
+        
+        def build_row(comp: TieredComparisonResult) -> tuple:
+            """Build the values of one data row in fieldnames order, up to the threshold flag columns."""
+            exec1 = comp.exec1_metrics
+            exec2 = comp.exec2_metrics
             
-            # Add Is_Large_Migration column if threshold is specified
-            if data_size_threshold is not None:
-                fieldnames.append('Is_Large_Migration')
-                
-            # Add efficiency flag columns if threshold is specified
-            if efficiency_threshold is not None:
-                fieldnames.extend(['Exec1_Is_Low_Efficiency', 'Exec2_Is_Low_Efficiency'])
+            # Calculate efficiency percentages
+            exec1_used_cpu_time = exec1.total_used_cpu_time
+            exec1_waste_percent = (exec1.cpu_inefficiency / exec1_used_cpu_time * 100) if exec1_used_cpu_time > 0 else 0
+            exec2_used_cpu_time = exec2.total_used_cpu_time
+            exec2_waste_percent = (exec2.cpu_inefficiency / exec2_used_cpu_time * 100) if exec2_used_cpu_time > 0 else 0
             
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+            row = (
+                _csv_field(comp.migration_id),
+                exec1.total_data_size_gb,
+                exec1.total_execution_time,
+                exec2.total_execution_time,
+                comp.execution_time_diff,
+                exec1.total_workers,
+                exec2.total_workers,
+                comp.worker_count_diff,
+                exec1.total_cpus,
+                exec2.total_cpus,
+                comp.cpu_count_diff,
+                exec1.cpu_time,
+                exec2.cpu_time,
+                comp.cpu_time_diff,
+                exec1.total_active_cpu_time,
+                exec1.average_cpu_efficiency_percent,
+                exec1_waste_percent,
+                exec2.total_active_cpu_time,
+                exec2.average_cpu_efficiency_percent,
+                exec2_waste_percent,
+                # Per-tier counts in TIERS order, one C-level map over each tier dict
+                *map(exec1.workers_by_tier.get, TIERS, TIER_ZERO_COUNTS),
+                *map(exec1.stragglers_by_tier.get, TIERS, TIER_ZERO_COUNTS),
+                *map(exec1.cpus_by_tier.get, TIERS, TIER_ZERO_COUNTS),
+                *map(exec2.workers_by_tier.get, TIERS, TIER_ZERO_COUNTS),
+                *map(exec2.stragglers_by_tier.get, TIERS, TIER_ZERO_COUNTS),
+                *map(exec2.cpus_by_tier.get, TIERS, TIER_ZERO_COUNTS),
+            )
             
-            # Write data rows
-            for comp in comparisons:
-                exec1 = comp.exec1_metrics
-                exec2 = comp.exec2_metrics
-                
-                # Calculate efficiency percentages
-                exec1_waste_percent = (exec1.cpu_inefficiency / exec1.total_used_cpu_time * 100) if exec1.total_used_cpu_time > 0 else 0
-                exec2_waste_percent = (exec2.cpu_inefficiency / exec2.total_used_cpu_time * 100) if exec2.total_used_cpu_time > 0 else 0
-                
-                row = {
-                    'Migration_ID': comp.migration_id,
-                    'Data_Size_GB': f"{exec1.total_data_size_gb:.2f}",
-                    'Exec1_Execution_Time': f"{exec1.total_execution_time:.2f}",
-                    'Exec2_Execution_Time': f"{exec2.total_execution_time:.2f}",
-                    'Execution_Time_Ex2_minus_Ex1': f"{comp.execution_time_diff:.2f}",
-                    'Exec1_Workers': exec1.total_workers,
-                    'Exec2_Workers': exec2.total_workers,
-                    'Worker_Ex2_minus_Ex1': comp.worker_count_diff,
-                    'Exec1_CPUs': exec1.total_cpus,
-                    'Exec2_CPUs': exec2.total_cpus,
-                    'CPU_Ex2_minus_Ex1': comp.cpu_count_diff,
-                    'Exec1_CPU_Time': f"{exec1.cpu_time:.2f}",
-                    'Exec2_CPU_Time': f"{exec2.cpu_time:.2f}",
-                    'CPU_Time_Ex2_minus_Ex1': f"{comp.cpu_time_diff:.2f}",
-                    'Exec1_CPU_Active_Time': f"{exec1.total_active_cpu_time:.2f}",
-                    'Exec1_CPU_Efficiency_Percent': f"{exec1.average_cpu_efficiency_percent:.2f}",
-                    'Exec1_CPU_Waste_Percent': f"{exec1_waste_percent:.2f}",
-                    'Exec2_CPU_Active_Time': f"{exec2.total_active_cpu_time:.2f}",
-                    'Exec2_CPU_Efficiency_Percent': f"{exec2.average_cpu_efficiency_percent:.2f}",
-                    'Exec2_CPU_Waste_Percent': f"{exec2_waste_percent:.2f}",
-                    'Exec1_Small_Workers': exec1.workers_by_tier.get('SMALL', 0),
-                    'Exec1_Medium_Workers': exec1.workers_by_tier.get('MEDIUM', 0),
-                    'Exec1_Large_Workers': exec1.workers_by_tier.get('LARGE', 0),
-                    'Exec1_Small_Stragglers': exec1.stragglers_by_tier.get('SMALL', 0),
-                    'Exec1_Medium_Stragglers': exec1.stragglers_by_tier.get('MEDIUM', 0),
-                    'Exec1_Large_Stragglers': exec1.stragglers_by_tier.get('LARGE', 0),
-                    'Exec1_Small_CPUs': exec1.cpus_by_tier.get('SMALL', 0),
-                    'Exec1_Medium_CPUs': exec1.cpus_by_tier.get('MEDIUM', 0),
-                    'Exec1_Large_CPUs': exec1.cpus_by_tier.get('LARGE', 0),
-                    'Exec2_Small_Workers': exec2.workers_by_tier.get('SMALL', 0),
-                    'Exec2_Medium_Workers': exec2.workers_by_tier.get('MEDIUM', 0),
-                    'Exec2_Large_Workers': exec2.workers_by_tier.get('LARGE', 0),
-                    'Exec2_Small_Stragglers': exec2.stragglers_by_tier.get('SMALL', 0),
-                    'Exec2_Medium_Stragglers': exec2.stragglers_by_tier.get('MEDIUM', 0),
-                    'Exec2_Large_Stragglers': exec2.stragglers_by_tier.get('LARGE', 0),
-                    'Exec2_Small_CPUs': exec2.cpus_by_tier.get('SMALL', 0),
-                    'Exec2_Medium_CPUs': exec2.cpus_by_tier.get('MEDIUM', 0),
-                    'Exec2_Large_CPUs': exec2.cpus_by_tier.get('LARGE', 0),
-                }
-                
-                # Add large migration flag if threshold is specified
-                if data_size_threshold is not None:
-                    row['Is_Large_Migration'] = 'Yes' if exec1.total_data_size_gb >= data_size_threshold else 'No'
-                    
-                # Add efficiency flags if threshold is specified
-                if efficiency_threshold is not None:
-                    row['Exec1_Is_Low_Efficiency'] = 'Yes' if (exec1.average_cpu_efficiency_percent > 0 and exec1.average_cpu_efficiency_percent < efficiency_threshold) else 'No'
-                    row['Exec2_Is_Low_Efficiency'] = 'Yes' if (exec2.average_cpu_efficiency_percent > 0 and exec2.average_cpu_efficiency_percent < efficiency_threshold) else 'No'
-                
-                writer.writerow(row)
+            return row
+        
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as csvfile:
+            # Header comments first, then the column header and data rows
+            csvfile.write("\n".join(header_lines) + "\n")
+            csvfile.write(",".join(fieldnames) + CSV_LINE_TERMINATOR)
+            # Flag cells (Is_Large_Migration, Exec1/Exec2_Is_Low_Efficiency) follow the fixed columns
+            row_flags = zip(*flag_columns) if flag_columns else repeat(())
+            for comp, flags in zip(comparisons, row_flags):
+                csvfile.write(row_format % (build_row(comp) + flags))
         
         print(f"CSV comparison report saved to: {output_file}")
     
-    def generate_comparison_report(self, comparisons: List[TieredComparisonResult], exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None) -> str:
+    def generate_comparison_report(self, comparisons: List[TieredComparisonResult], exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None, config_comparison: Dict[str, any] = None) -> str:
         """Generate a formatted text report of the comparison results."""
         lines = []
         
@@ -771,20 +1119,8 @@ class TieredComparisonAnalyzer:
             lines.append("CONFIGURATION COMPARISON")
             lines.append("="*60)
             
-            config_keys = [
-                'small_tier_max_sstable_size_gb',
-                'small_tier_thread_subset_max_size_floor_gb', 
-                'small_tier_worker_num_threads',
-                'medium_tier_max_sstable_size_gb',
-                'medium_tier_thread_subset_max_size_floor_gb',
-                'medium_tier_worker_num_threads',
-                'optimize_packing_medium_subsets',
-                'skip_small_subsets',
-                'execution_mode',
-                'max_concurrent_workers'
-            ]
-            first_comp = comparisons[0]
-            config_comparison = first_comp.get_config_comparison(config_keys)
+            if config_comparison is None:
+                config_comparison = self.compare_configs(comparisons)
             
             lines.append("")
             lines.append(f"{'Parameter':<40} {'Exec1':<15} {'Exec2':<15} {'Status':<10}")
@@ -807,41 +1143,32 @@ class TieredComparisonAnalyzer:
         lines.append(f"{'':12} {'(GB)':<8} {'-'*30} {'-'*25} {'-'*25} {'-'*30}")
         
         # Data rows
+        format_row = TEXT_ROW_TEMPLATE.format
+        format_time = self._format_time
         for comp in comparisons:
             exec1 = comp.exec1_metrics
             exec2 = comp.exec2_metrics
             
             # Format values and differences
-            exec1_time = self._format_time(exec1.total_execution_time)
-            exec2_time = self._format_time(exec2.total_execution_time)
-            time_diff = f"{comp.execution_time_diff:+.1f}s" if abs(comp.execution_time_diff) < 60 else f"{comp.execution_time_diff/60:+.1f}m"
+            exec1_time = format_time(exec1.total_execution_time)
+            exec2_time = format_time(exec2.total_execution_time)
+            exec_time_delta = comp.execution_time_diff
+            time_diff = f"{exec_time_delta:+.1f}s" if -60 < exec_time_delta < 60 else f"{exec_time_delta/60:+.1f}m"
             
-            exec1_cpu_time = self._format_time(exec1.cpu_time)
-            exec2_cpu_time = self._format_time(exec2.cpu_time)
-            cpu_time_diff = f"{comp.cpu_time_diff:+.1f}s" if abs(comp.cpu_time_diff) < 60 else f"{comp.cpu_time_diff/60:+.1f}m"
+            exec1_cpu_time = format_time(exec1.cpu_time)
+            exec2_cpu_time = format_time(exec2.cpu_time)
+            cpu_time_delta = comp.cpu_time_diff
+            cpu_time_diff = f"{cpu_time_delta:+.1f}s" if -60 < cpu_time_delta < 60 else f"{cpu_time_delta/60:+.1f}m"
             
             # Format worker counts with straggler information
-            def format_worker_text(workers, stragglers):
-                if workers == 0:
-                    return "0"
-                elif stragglers > 0:
-                    return f"{workers}[{stragglers}]"
-                else:
-                    return str(workers)
-            
-            exec1_workers_text = format_worker_text(exec1.total_workers, sum(exec1.stragglers_by_tier.values()))
-            exec2_workers_text = format_worker_text(exec2.total_workers, sum(exec2.stragglers_by_tier.values()))
-            
-            worker_diff = f"{comp.worker_count_diff:+d}"
-            cpu_diff = f"{comp.cpu_count_diff:+d}"
-            
-            # Data size (should be same for both executions)
-            data_size_str = f"{exec1.total_data_size_gb:.1f}"
+            exec1_workers_text = _format_worker_text(exec1.total_workers, exec1.total_stragglers)
+            exec2_workers_text = _format_worker_text(exec2.total_workers, exec2.total_stragglers)
             
-            lines.append(f"{comp.migration_id:<12} {data_size_str:<8} {exec1_time:<10} {exec2_time:<10} {time_diff:<8} "
-                        f"{exec1_workers_text:<8} {exec2_workers_text:<8} {worker_diff:<6} "
-                        f"{exec1.total_cpus:<8} {exec2.total_cpus:<8} {cpu_diff:<6} "
-                        f"{exec1_cpu_time:<10} {exec2_cpu_time:<10} {cpu_time_diff:<8}")
+            # Data size (should be same for both executions) and signed diffs are formatted by the template
+            lines.append(format_row(comp.migration_id, exec1.total_data_size_gb, exec1_time, exec2_time, time_diff,
+                                    exec1_workers_text, exec2_workers_text, comp.worker_count_diff,
+                                    exec1.total_cpus, exec2.total_cpus, comp.cpu_count_diff,
+                                    exec1_cpu_time, exec2_cpu_time, cpu_time_diff))
         
         # Summary statistics
         lines.append("")
@@ -849,17 +1176,18 @@ class TieredComparisonAnalyzer:
         lines.append("AGGREGATE ANALYSIS")
         lines.append("="*115)
         
-        total_exec1_time = sum(c.exec1_metrics.total_execution_time for c in comparisons)
-        total_exec2_time = sum(c.exec2_metrics.total_execution_time for c in comparisons)
+        totals = self._compute_aggregate_totals(comparisons)
+        total_exec1_time = totals.exec1_time
+        total_exec2_time = totals.exec2_time
         
-        total_exec1_workers = sum(c.exec1_metrics.total_workers for c in comparisons)
-        total_exec2_workers = sum(c.exec2_metrics.total_workers for c in comparisons)
+        total_exec1_workers = totals.exec1_workers
+        total_exec2_workers = totals.exec2_workers
         
-        total_exec1_cpus = sum(c.exec1_metrics.total_cpus for c in comparisons)
-        total_exec2_cpus = sum(c.exec2_metrics.total_cpus for c in comparisons)
+        total_exec1_cpus = totals.exec1_cpus
+        total_exec2_cpus = totals.exec2_cpus
         
-        total_exec1_cpu_time = sum(c.exec1_metrics.cpu_time for c in comparisons)
-        total_exec2_cpu_time = sum(c.exec2_metrics.cpu_time for c in comparisons)
+        total_exec1_cpu_time = totals.exec1_cpu_time
+        total_exec2_cpu_time = totals.exec2_cpu_time
         
         lines.append("")
         lines.append("Total Execution Time:")
@@ -891,120 +1219,82 @@ class TieredComparisonAnalyzer:
         
         return "\n".join(lines)
     
-    def save_comparison_report(self, comparisons: List[TieredComparisonResult], output_file: str, exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None):
+    def save_comparison_report(self, comparisons: List[TieredComparisonResult], output_file: str, exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None, config_comparison: Dict[str, any] = None):
         """Save the comparison report to a text file."""
-        report_content = self.generate_comparison_report(comparisons, exec1_name, exec2_name, exec1_only, exec2_only, data_size_threshold)
+        report_content = self.generate_comparison_report(comparisons, exec1_name, exec2_name, exec1_only, exec2_only, data_size_threshold, config_comparison)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open(output_file, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as f:
             f.write(report_content)
         
         print(f"Text comparison report saved to: {output_file}")
     
-    def generate_html_report(self, comparisons: List[TieredComparisonResult], exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None, efficiency_threshold: float = None) -> str:
+    def generate_html_report(self, comparisons: List[TieredComparisonResult], exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None, efficiency_threshold: float = None, config_comparison: Dict[str, any] = None) -> str:
         """Generate an HTML comparison report for browser viewing."""
+        buffer = io.StringIO()
+        self.write_html_report(buffer, comparisons, exec1_name, exec2_name, exec1_only, exec2_only, data_size_threshold, efficiency_threshold, config_comparison)
+        return buffer.getvalue()
+    
+    def write_html_report(self, out: TextIO, comparisons: List[TieredComparisonResult], exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None, efficiency_threshold: float = None, config_comparison: Dict[str, any] = None):
+        """Write the HTML comparison report to a text stream fragment by fragment."""
+        # Both public entry points funnel through here: save_html_report passes the buffered
+        # output file, generate_html_report an in-memory StringIO
+        write = out.write
         if not comparisons:
-            return "<html><body><h1>No comparisons to display.</h1></body></html>"
+            write("<html><body><h1>No comparisons to display.</h1></body></html>")
+            return
         
         # Calculate aggregate totals for summary
-        total_exec1_time = sum(c.exec1_metrics.total_execution_time for c in comparisons)
-        total_exec2_time = sum(c.exec2_metrics.total_execution_time for c in comparisons)
-        total_exec1_workers = sum(c.exec1_metrics.total_workers for c in comparisons)
-        total_exec2_workers = sum(c.exec2_metrics.total_workers for c in comparisons)
-        total_exec1_cpus = sum(c.exec1_metrics.total_cpus for c in comparisons)
-        total_exec2_cpus = sum(c.exec2_metrics.total_cpus for c in comparisons)
-        total_exec1_cpu_time = sum(c.exec1_metrics.cpu_time for c in comparisons)
-        total_exec2_cpu_time = sum(c.exec2_metrics.cpu_time for c in comparisons)
-        total_data_size_gb = sum(c.exec1_metrics.total_data_size_gb for c in comparisons)
+        totals = self._compute_aggregate_totals(comparisons)
+        total_exec1_time = totals.exec1_time
+        total_exec2_time = totals.exec2_time
+        total_exec1_workers = totals.exec1_workers
+        total_exec2_workers = totals.exec2_workers
+        total_exec1_cpus = totals.exec1_cpus
+        total_exec2_cpus = totals.exec2_cpus
+        total_exec1_cpu_time = totals.exec1_cpu_time
+        total_exec2_cpu_time = totals.exec2_cpu_time
+        total_data_size_gb = totals.data_size_gb
         
         # Generate timestamp
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Tiered vs Tiered Migration Comparison</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #fafafa; }}
-        h1, h2 {{ color: #333; }}
-        .header {{ background-color: #e8f5e8; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-        .config {{ background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .summary {{ background-color: #e8f4f8; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .aggregate {{ background-color: #fff3e0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .config-comparison {{ background-color: #f0f8ff; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .config-same {{ background-color: #e8f5e8 !important; }}
-        .config-different {{ background-color: #ffe8e8 !important; }}
-        .has-stragglers {{ background-color: #ffcccc !important; }} /* Light red for cells with stragglers */
-        .large-migration {{ background-color: #ffe4b5 !important; border-left: 4px solid #ff8c00 !important; }}
-        .low-efficiency {{ background-color: #ffff00 !important; font-weight: bold; }} /* Bright yellow for low efficiency migrations */
-        .best-efficiency {{ background-color: #c8e6c9 !important; font-weight: bold; }} /* Light green for best efficiency */
-        
-        table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; background-color: white; }}
-        th, td {{ border: 1px solid #ddd; padding: 10px; text-align: left; }}
-        th {{ background-color: #f2f2f2; font-weight: bold; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        tr:hover {{ background-color: #f0f0f0; }}
-        
-        /* Thicker borders for metric group separators */
-        .group-separator-left {{ border-left: 3px solid #333 !important; }}
-        .group-separator-right {{ border-right: 3px solid #333 !important; }}
-        
-        .migration-details {{ margin-top: 20px; }}
-        .best-time {{ background-color: #c8e6c9 !important; font-weight: bold; }}
-        .best-ratio {{ background-color: #c8e6c9 !important; font-weight: bold; }}
-        .positive-diff {{ background-color: #add8e6 !important; }} /* Light blue for positive differences */
-        .negative-diff {{ background-color: #fff8dc !important; }} /* Light yellow for negative differences */
-        
-        .metric-section {{ margin-bottom: 30px; }}
-        .exclusive-migrations {{ background-color: #fff8e1; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        
-        .ratio-header {{ font-size: 0.9em; }}
-        .number {{ text-align: right; }}
-    </style>
-</head>
-<body>
-<div class="header">
-    <h1>Tiered vs Tiered Migration Simulation Comparison</h1>
-    <p><strong>Generated:</strong> {timestamp}</p>
-</div>
-
-<div class="config">
-    <h2>Comparison Details</h2>"""
+        write(HTML_HEADER_TEMPLATE.format(timestamp=timestamp))
         
         if exec1_name and exec2_name:
-            html += f"""
-    <p><strong>Execution 1:</strong> {exec1_name}</p>
-    <p><strong>Execution 2:</strong> {exec2_name}</p>
-    <p><strong>Common Migrations:</strong> {len(comparisons)}</p>"""
+            write(f"""
+    <p><strong>Execution 1:</strong> {escape(exec1_name)}</p>
+    <p><strong>Execution 2:</strong> {escape(exec2_name)}</p>
+    <p><strong>Common Migrations:</strong> {len(comparisons)}</p>""")
         else:
-            html += f"""
-    <p><strong>Common Migrations:</strong> {len(comparisons)}</p>"""
+            write(f"""
+    <p><strong>Common Migrations:</strong> {len(comparisons)}</p>""")
         
         # Data size threshold information
         if data_size_threshold is not None:
             large_migrations = [comp for comp in comparisons if comp.exec1_metrics.total_data_size_gb >= data_size_threshold]
-            html += f"""
-    <p><strong>Large Migrations:</strong> {len(large_migrations)} (>= {data_size_threshold} GB)</p>"""
+            write(f"""
+    <p><strong>Large Migrations:</strong> {len(large_migrations)} (>= {data_size_threshold} GB)</p>""")
         
         if efficiency_threshold is not None:
             low_efficiency_exec1 = sum(1 for comp in comparisons if comp.exec1_metrics.average_cpu_efficiency_percent > 0 and comp.exec1_metrics.average_cpu_efficiency_percent < efficiency_threshold)
             low_efficiency_exec2 = sum(1 for comp in comparisons if comp.exec2_metrics.average_cpu_efficiency_percent > 0 and comp.exec2_metrics.average_cpu_efficiency_percent < efficiency_threshold)
-            html += f"""
-    <p><strong>Low Efficiency Threshold:</strong> {efficiency_threshold:.1f}% (Exec1: {low_efficiency_exec1}, Exec2: {low_efficiency_exec2} migrations)</p>"""
+            write(f"""
+    <p><strong>Low Efficiency Threshold:</strong> {efficiency_threshold:.1f}% (Exec1: {low_efficiency_exec1}, Exec2: {low_efficiency_exec2} migrations)</p>""")
         
         if exec1_only or exec2_only:
-            html += f"""</div>
+            write(f"""</div>
 
 <div class="exclusive-migrations">
-    <h2>Exclusive Migrations</h2>"""
+    <h2>Exclusive Migrations</h2>""")
             if exec1_only:
-                html += f"""
-    <p><strong>Execution 1 Only ({len(exec1_only)}):</strong> {', '.join(sorted(exec1_only))}</p>"""
+                write(f"""
+    <p><strong>Execution 1 Only ({len(exec1_only)}):</strong> {', '.join(map(escape, sorted(exec1_only)))}</p>""")
             if exec2_only:
-                html += f"""
-    <p><strong>Execution 2 Only ({len(exec2_only)}):</strong> {', '.join(sorted(exec2_only))}</p>"""
+                write(f"""
+    <p><strong>Execution 2 Only ({len(exec2_only)}):</strong> {', '.join(map(escape, sorted(exec2_only)))}</p>""")
         
-        html += f"""</div>
+        write(f"""</div>
 
 <div class="summary">
     <h2>Aggregate Analysis</h2>
@@ -1013,7 +1303,7 @@ class TieredComparisonAnalyzer:
             <h3>Total Execution Time</h3>
             <p><strong>Execution 1:</strong> {self._format_time(total_exec1_time)}</p>
             <p><strong>Execution 2:</strong> {self._format_time(total_exec2_time)}</p>
-            <p><strong>Difference:</strong> {'+' if (total_exec2_time - total_exec1_time) >= 0 else ''}{self._format_time(total_exec2_time - total_exec1_time) if (total_exec2_time - total_exec1_time) >= 0 else '-' + self._format_time(abs(total_exec2_time - total_exec1_time))} (Exec2 {'slower' if total_exec2_time > total_exec1_time else 'faster' if total_exec2_time < total_exec1_time else 'same'})</p>
+            <p><strong>Difference:</strong> {self._format_signed_time(total_exec2_time - total_exec1_time, True)} (Exec2 {'slower' if total_exec2_time > total_exec1_time else 'faster' if total_exec2_time < total_exec1_time else 'same'})</p>
         </div>
         <div>
             <h3>Total Data Size</h3>
@@ -1036,313 +1326,214 @@ class TieredComparisonAnalyzer:
             <h3>Total CPU Time</h3>
             <p><strong>Execution 1:</strong> {self._format_time(total_exec1_cpu_time)}</p>
             <p><strong>Execution 2:</strong> {self._format_time(total_exec2_cpu_time)}</p>
-            <p><strong>Difference:</strong> {'+' if (total_exec2_cpu_time - total_exec1_cpu_time) >= 0 else ''}{self._format_time(total_exec2_cpu_time - total_exec1_cpu_time) if (total_exec2_cpu_time - total_exec1_cpu_time) >= 0 else '-' + self._format_time(abs(total_exec2_cpu_time - total_exec1_cpu_time))} (Exec2 {'more' if total_exec2_cpu_time > total_exec1_cpu_time else 'less' if total_exec2_cpu_time < total_exec1_cpu_time else 'same'})</p>
+            <p><strong>Difference:</strong> {self._format_signed_time(total_exec2_cpu_time - total_exec1_cpu_time, True)} (Exec2 {'more' if total_exec2_cpu_time > total_exec1_cpu_time else 'less' if total_exec2_cpu_time < total_exec1_cpu_time else 'same'})</p>
         </div>
     </div>
 </div>
 
 <div class="config-comparison">
     <h2>Configuration Comparison</h2>
-    {self._generate_config_comparison_html(comparisons, exec1_name, exec2_name)}
+    {self._generate_config_comparison_html(comparisons, exec1_name, exec2_name, config_comparison)}
 </div>
 
 <div class="migration-details">
-    <h2>Per-Migration Comparison</h2>"""
+    <h2>Per-Migration Comparison</h2>""")
         
-        # Add legend for large migrations if threshold is specified
+        # Legend entries for large-migration and efficiency highlighting, if thresholds are specified
+        legend_items = []
         if data_size_threshold is not None:
-            html += f"""
-    <p><strong>Legend:</strong> 
-        <span style="background-color: #ffe4b5; padding: 2px 6px; border-radius: 3px; border-left: 4px solid #ff8c00;">Orange highlighting</span> indicates large migrations (>= {data_size_threshold} GB)
-    </p>"""
-        
-        # Add legend for efficiency highlighting if threshold is specified
+            legend_items.append(f'<span style="background-color: #ffe4b5; padding: 2px 6px; border-radius: 3px; border-left: 4px solid #ff8c00;">Orange highlighting</span> indicates large migrations (>= {data_size_threshold} GB)')
         if efficiency_threshold is not None:
-            efficiency_legend_text = f'<span style="background-color: #ffff00; padding: 2px 6px; border-radius: 3px; font-weight: bold;">Yellow highlighting</span> indicates low efficiency migrations (< {efficiency_threshold}%)'
-            if data_size_threshold is not None:
-                # Extend existing legend by finding the specific legend paragraph
-                legend_marker = 'indicates large migrations'
-                if legend_marker in html:
-                    html = html.replace(f'{legend_marker} (>= {data_size_threshold} GB)\n    </p>', f'{legend_marker} (>= {data_size_threshold} GB), {efficiency_legend_text}\n    </p>')
-            else:
-                # Create new legend
-                html += f"""
+            legend_items.append(f'<span style="background-color: #ffff00; padding: 2px 6px; border-radius: 3px; font-weight: bold;">Yellow highlighting</span> indicates low efficiency migrations (< {efficiency_threshold}%)')
+        if legend_items:
+            write(f"""
     <p><strong>Legend:</strong> 
-        {efficiency_legend_text}
-    </p>"""
+        {', '.join(legend_items)}
+    </p>""")
         
-        html += """
-    <table>
-        <thead>
-            <tr>
-                <th rowspan="2">Migration ID</th>
-                <th rowspan="2">Data Size (GB)</th>
-                <th colspan="3" class="group-separator-left">Execution Time</th>
-                <th colspan="3" class="group-separator-left">Workers</th>
-                <th colspan="3" class="group-separator-left">CPUs</th>
-                <th colspan="3" class="group-separator-left">CPU Time</th>
-                <th colspan="3" class="group-separator-left">CPU Efficiency (Exec1)</th>
-                <th colspan="3" class="group-separator-left">CPU Efficiency (Exec2)</th>
-                <th colspan="6" class="group-separator-left">Exec1 Tier Distribution</th>
-                <th colspan="6" class="group-separator-left">Exec2 Tier Distribution</th>
-            </tr>
-            <tr>
-                <th class="group-separator-left">Exec1</th>
-                <th>Exec2</th>
-                <th class="diff-header">Ex2 - Ex1</th>
-                <th class="group-separator-left">Exec1</th>
-                <th>Exec2</th>
-                <th class="diff-header">Ex2 - Ex1</th>
-                <th class="group-separator-left">Exec1</th>
-                <th>Exec2</th>
-                <th class="diff-header">Ex2 - Ex1</th>
-                <th class="group-separator-left">Exec1</th>
-                <th>Exec2</th>
-                <th class="diff-header">Ex2 - Ex1</th>
-                <th class="group-separator-left">Active Time</th>
-                <th>Eff %</th>
-                <th>Waste %</th>
-                <th class="group-separator-left">Active Time</th>
-                <th>Eff %</th>
-                <th>Waste %</th>
-                <th class="group-separator-left">Small W</th>
-                <th>Med W</th>
-                <th>Large W</th>
-                <th>Small C</th>
-                <th>Med C</th>
-                <th>Large C</th>
-                <th class="group-separator-left">Small W</th>
-                <th>Med W</th>
-                <th>Large W</th>
-                <th>Small C</th>
-                <th>Med C</th>
-                <th>Large C</th>
-            </tr>
-        </thead>
-        <tbody>"""
+        write(HTML_TABLE_HEADER)
         
         # Sort comparisons by data size (descending) before processing
-        comparisons_sorted = sorted(comparisons, key=lambda comp: comp.exec1_metrics.total_data_size_gb, reverse=True)
+        comparisons_sorted = sorted(comparisons, key=attrgetter('exec1_metrics.total_data_size_gb'), reverse=True)
         
-        # Process each comparison and determine best values for highlighting
-        for comp in comparisons_sorted:
-            exec1 = comp.exec1_metrics
-            exec2 = comp.exec2_metrics
-            
-            # Determine best execution time and CPU time (only when genuinely different)
-            best_exec_time = "exec1" if exec1.total_execution_time < exec2.total_execution_time else ("exec2" if exec2.total_execution_time < exec1.total_execution_time else None)
-            best_cpu_time = "exec1" if exec1.cpu_time < exec2.cpu_time else ("exec2" if exec2.cpu_time < exec1.cpu_time else None)
-            best_worker_count = "exec1" if exec1.total_workers < exec2.total_workers else ("exec2" if exec2.total_workers < exec1.total_workers else None)
-            
-            # Format values
-            exec1_time_str = self._format_time(exec1.total_execution_time)
-            exec2_time_str = self._format_time(exec2.total_execution_time)
-            exec1_cpu_time_str = self._format_time(exec1.cpu_time)
-            exec2_cpu_time_str = self._format_time(exec2.cpu_time)
-            
-            # Format differences with appropriate sign and color
-            exec_time_diff_str = self._format_time(abs(comp.execution_time_diff))
-            exec_time_diff_class = "positive-diff" if comp.execution_time_diff > 0 else "negative-diff" if comp.execution_time_diff < 0 else ""
-            
-            worker_diff_str = f"{comp.worker_count_diff:+d}"
-            worker_diff_class = "positive-diff" if comp.worker_count_diff > 0 else "negative-diff" if comp.worker_count_diff < 0 else ""
-            
-            cpu_diff_str = f"{comp.cpu_count_diff:+d}"
-            cpu_diff_class = "positive-diff" if comp.cpu_count_diff > 0 else "negative-diff" if comp.cpu_count_diff < 0 else ""
-            
-            cpu_time_diff_str = self._format_time(abs(comp.cpu_time_diff))
-            cpu_time_diff_class = "positive-diff" if comp.cpu_time_diff > 0 else "negative-diff" if comp.cpu_time_diff < 0 else ""
-            
-            # Add sign to time differences for display
-            if comp.execution_time_diff > 0:
-                exec_time_diff_str = f"+{exec_time_diff_str}"
-            elif comp.execution_time_diff < 0:
-                exec_time_diff_str = f"-{exec_time_diff_str}"
-            
-            if comp.cpu_time_diff > 0:
-                cpu_time_diff_str = f"+{cpu_time_diff_str}"
-            elif comp.cpu_time_diff < 0:
-                cpu_time_diff_str = f"-{cpu_time_diff_str}"
-            
-            # Format worker counts with straggler information
-            def format_worker_cell(workers, stragglers, tier_name, exec_name):
-                if workers == 0:
-                    return ('0', '')
-                elif stragglers > 0:
-                    return (f'{workers:,}[{stragglers}]', 'has-stragglers')
-                else:
-                    return (f'{workers:,}', '')
-            
-            # Format exec1 tier worker cells
-            exec1_small_w, exec1_small_w_class = format_worker_cell(
-                exec1.workers_by_tier.get('SMALL', 0), 
-                exec1.stragglers_by_tier.get('SMALL', 0), 
-                'SMALL', 'exec1'
-            )
-            exec1_medium_w, exec1_medium_w_class = format_worker_cell(
-                exec1.workers_by_tier.get('MEDIUM', 0), 
-                exec1.stragglers_by_tier.get('MEDIUM', 0), 
-                'MEDIUM', 'exec1'
-            )
-            exec1_large_w, exec1_large_w_class = format_worker_cell(
-                exec1.workers_by_tier.get('LARGE', 0), 
-                exec1.stragglers_by_tier.get('LARGE', 0), 
-                'LARGE', 'exec1'
-            )
-            
-            # Format exec2 tier worker cells
-            exec2_small_w, exec2_small_w_class = format_worker_cell(
-                exec2.workers_by_tier.get('SMALL', 0), 
-                exec2.stragglers_by_tier.get('SMALL', 0), 
-                'SMALL', 'exec2'
-            )
-            exec2_medium_w, exec2_medium_w_class = format_worker_cell(
-                exec2.workers_by_tier.get('MEDIUM', 0), 
-                exec2.stragglers_by_tier.get('MEDIUM', 0), 
-                'MEDIUM', 'exec2'
-            )
-            exec2_large_w, exec2_large_w_class = format_worker_cell(
-                exec2.workers_by_tier.get('LARGE', 0), 
-                exec2.stragglers_by_tier.get('LARGE', 0), 
-                'LARGE', 'exec2'
-            )
-
-            # Determine if this is a large migration
-            is_large_migration = data_size_threshold is not None and exec1.total_data_size_gb >= data_size_threshold
-            migration_id_class = "large-migration" if is_large_migration else ""
-            data_size_class = "large-migration" if is_large_migration else ""
-            
-            # Calculate efficiency metrics and determine low efficiency highlighting
-            exec1_inefficiency_percent = (exec1.cpu_inefficiency / exec1.total_used_cpu_time * 100) if exec1.total_used_cpu_time > 0 else 0
-            exec2_inefficiency_percent = (exec2.cpu_inefficiency / exec2.total_used_cpu_time * 100) if exec2.total_used_cpu_time > 0 else 0
-            
-            # Determine efficiency highlighting
-            exec1_is_low_efficiency = (efficiency_threshold is not None and 
-                                     exec1.average_cpu_efficiency_percent > 0 and 
-                                     exec1.average_cpu_efficiency_percent < efficiency_threshold)
-            exec2_is_low_efficiency = (efficiency_threshold is not None and 
-                                     exec2.average_cpu_efficiency_percent > 0 and 
-                                     exec2.average_cpu_efficiency_percent < efficiency_threshold)
-            
-            exec1_efficiency_class = "low-efficiency" if exec1_is_low_efficiency else ""
-            exec2_efficiency_class = "low-efficiency" if exec2_is_low_efficiency else ""
-            
-            # Determine best efficiency percentage highlighting (separate from low-efficiency highlighting)
-            exec1_efficiency_percent_class = exec1_efficiency_class  # Start with low-efficiency class if applicable
-            exec2_efficiency_percent_class = exec2_efficiency_class  # Start with low-efficiency class if applicable
-            
-            # Add best efficiency highlighting only to percentage columns (only if not already low-efficiency)
-            if (exec1.average_cpu_efficiency_percent > 0 and exec2.average_cpu_efficiency_percent > 0 and 
-                exec1.average_cpu_efficiency_percent != exec2.average_cpu_efficiency_percent):
-                if exec1.average_cpu_efficiency_percent > exec2.average_cpu_efficiency_percent:
-                    # Exec1 has better efficiency, highlight only if not low efficiency
-                    if not exec1_is_low_efficiency:
-                        exec1_efficiency_percent_class = "best-efficiency"
-                else:
-                    # Exec2 has better efficiency, highlight only if not low efficiency  
-                    if not exec2_is_low_efficiency:
-                        exec2_efficiency_percent_class = "best-efficiency"
+        write(self._render_html_rows(comparisons_sorted, data_size_threshold, efficiency_threshold))
+        
+        write(HTML_FOOTER)
 
-            html += f"""
-            <tr>
-                <td class="{migration_id_class}"><strong>{comp.migration_id}</strong></td>
-                <td class="number {data_size_class}">{exec1.total_data_size_gb:.1f}</td>
-                <td class="number group-separator-left {'best-time' if best_exec_time == 'exec1' else ''}">{exec1_time_str}</td>
-                <td class="number {'best-time' if best_exec_time == 'exec2' else ''}">{exec2_time_str}</td>
-                <td class="number {exec_time_diff_class}">{exec_time_diff_str}</td>
-                <td class="number group-separator-left {'best-time' if best_worker_count == 'exec1' else ''}">{exec1.total_workers:,}</td>
-                <td class="number {'best-time' if best_worker_count == 'exec2' else ''}">{exec2.total_workers:,}</td>
-                <td class="number {worker_diff_class}">{worker_diff_str}</td>
-                <td class="number group-separator-left">{exec1.total_cpus:,}</td>
-                <td class="number">{exec2.total_cpus:,}</td>
-                <td class="number {cpu_diff_class}">{cpu_diff_str}</td>
-                <td class="number group-separator-left {'best-time' if best_cpu_time == 'exec1' else ''}">{exec1_cpu_time_str}</td>
-                <td class="number {'best-time' if best_cpu_time == 'exec2' else ''}">{exec2_cpu_time_str}</td>
-                <td class="number {cpu_time_diff_class}">{cpu_time_diff_str}</td>
-                <td class="number group-separator-left {exec1_efficiency_class}">{exec1.total_active_cpu_time:.1f}s</td>
-                <td class="number {exec1_efficiency_percent_class}">{exec1.average_cpu_efficiency_percent:.1f}%</td>
-                <td class="number {exec1_efficiency_class}">{exec1_inefficiency_percent:.1f}%</td>
-                <td class="number group-separator-left {exec2_efficiency_class}">{exec2.total_active_cpu_time:.1f}s</td>
-                <td class="number {exec2_efficiency_percent_class}">{exec2.average_cpu_efficiency_percent:.1f}%</td>
-                <td class="number {exec2_efficiency_class}">{exec2_inefficiency_percent:.1f}%</td>
-                <td class="number group-separator-left {exec1_small_w_class}">{exec1_small_w}</td>
-                <td class="number {exec1_medium_w_class}">{exec1_medium_w}</td>
-                <td class="number {exec1_large_w_class}">{exec1_large_w}</td>
-                <td class="number">{exec1.cpus_by_tier.get('SMALL', 0):,}</td>
-                <td class="number">{exec1.cpus_by_tier.get('MEDIUM', 0):,}</td>
-                <td class="number">{exec1.cpus_by_tier.get('LARGE', 0):,}</td>
-                <td class="number group-separator-left {exec2_small_w_class}">{exec2_small_w}</td>
-                <td class="number {exec2_medium_w_class}">{exec2_medium_w}</td>
-                <td class="number {exec2_large_w_class}">{exec2_large_w}</td>
-                <td class="number">{exec2.cpus_by_tier.get('SMALL', 0):,}</td>
-                <td class="number">{exec2.cpus_by_tier.get('MEDIUM', 0):,}</td>
-                <td class="number">{exec2.cpus_by_tier.get('LARGE', 0):,}</td>
-            </tr>"""
+    @classmethod
+    def _render_html_row(cls, comp: TieredComparisonResult, large_migration_class: str = "", exec1_efficiency_class: str = "", exec2_efficiency_class: str = "") -> str:
+        """Render the per-migration <tr> row of the HTML report, highlighting the best values.
         
-        html += """
-        </tbody>
-    </table>
-</div>
+        The threshold highlighting classes are precomputed by _render_html_rows().
+        """
+        exec1 = comp.exec1_metrics
+        exec2 = comp.exec2_metrics
+        
+        # Bind per-tier dicts once per row
+        exec1_tier_workers = exec1.workers_by_tier
+        exec1_tier_stragglers = exec1.stragglers_by_tier
+        exec1_tier_cpus = exec1.cpus_by_tier
+        exec2_tier_workers = exec2.workers_by_tier
+        exec2_tier_stragglers = exec2.stragglers_by_tier
+        exec2_tier_cpus = exec2.cpus_by_tier
+        
+        # Highlight the best execution time, worker count and CPU time (only when genuinely different)
+        exec1_time, exec2_time = exec1.total_execution_time, exec2.total_execution_time
+        exec1_workers, exec2_workers = exec1.total_workers, exec2.total_workers
+        exec1_cpu_time, exec2_cpu_time = exec1.cpu_time, exec2.cpu_time
+        exec1_time_class, exec2_time_class = BEST_VALUE_CLASSES[(exec1_time > exec2_time) - (exec1_time < exec2_time)]
+        exec1_workers_class, exec2_workers_class = BEST_VALUE_CLASSES[(exec1_workers > exec2_workers) - (exec1_workers < exec2_workers)]
+        exec1_cpu_time_class, exec2_cpu_time_class = BEST_VALUE_CLASSES[(exec1_cpu_time > exec2_cpu_time) - (exec1_cpu_time < exec2_cpu_time)]
+        
+        # Format values
+        format_time = cls._format_time
+        exec1_time_str = format_time(exec1_time)
+        exec2_time_str = format_time(exec2_time)
+        exec1_cpu_time_str = format_time(exec1_cpu_time)
+        exec2_cpu_time_str = format_time(exec2_cpu_time)
+        
+        # Format differences with appropriate sign and color (the signed counts are formatted by the template)
+        exec_time_diff = comp.execution_time_diff
+        worker_diff = comp.worker_count_diff
+        cpu_diff = comp.cpu_count_diff
+        cpu_time_diff = comp.cpu_time_diff
+        
+        exec_time_diff_str = cls._format_signed_time(exec_time_diff)
+        exec_time_diff_class = DIFF_CLASSES[(exec_time_diff > 0) - (exec_time_diff < 0)]
+        worker_diff_class = DIFF_CLASSES[(worker_diff > 0) - (worker_diff < 0)]
+        cpu_diff_class = DIFF_CLASSES[(cpu_diff > 0) - (cpu_diff < 0)]
+        cpu_time_diff_str = cls._format_signed_time(cpu_time_diff)
+        cpu_time_diff_class = DIFF_CLASSES[(cpu_time_diff > 0) - (cpu_time_diff < 0)]
+        
+        # Format tier worker cells (with straggler information), one map per execution in TIERS order
+        ((exec1_small_w, exec1_small_w_class),
+         (exec1_medium_w, exec1_medium_w_class),
+         (exec1_large_w, exec1_large_w_class)) = map(
+            _format_worker_cell,
+            map(exec1_tier_workers.get, TIERS, TIER_ZERO_COUNTS),
+            map(exec1_tier_stragglers.get, TIERS, TIER_ZERO_COUNTS))
+        ((exec2_small_w, exec2_small_w_class),
+         (exec2_medium_w, exec2_medium_w_class),
+         (exec2_large_w, exec2_large_w_class)) = map(
+            _format_worker_cell,
+            map(exec2_tier_workers.get, TIERS, TIER_ZERO_COUNTS),
+            map(exec2_tier_stragglers.get, TIERS, TIER_ZERO_COUNTS))
+        exec1_small_c, exec1_medium_c, exec1_large_c = map(exec1_tier_cpus.get, TIERS, TIER_ZERO_COUNTS)
+        exec2_small_c, exec2_medium_c, exec2_large_c = map(exec2_tier_cpus.get, TIERS, TIER_ZERO_COUNTS)
 
-<div class="aggregate">
-    <h2>Legend</h2>
-    <p><span style="background-color: #c8e6c9; padding: 2px 6px; border-radius: 3px;">Green highlighting</span> indicates the best (lowest) execution time, CPU time, worker count, and best CPU efficiency for each migration.</p>
-    <p><strong>Column Abbreviations:</strong></p>
-    <ul>
-        <li><strong>W:</strong> Workers (number of workers allocated to each tier)</li>
-        <li><strong>C:</strong> CPUs/Cores (total threads allocated to each tier = workers × threads per worker)</li>
-    </ul>
-    <p><strong>CPU Efficiency Highlighting:</strong></p>
-    <ul>
-        <li><span style="background-color: #c8e6c9; padding: 2px 6px; border-radius: 3px; font-weight: bold;">Light green</span> indicates the execution with better CPU efficiency percentage for each migration</li>
-        <li><span style="background-color: #ffff00; padding: 2px 6px; border-radius: 3px; font-weight: bold;">Yellow highlighting</span> takes priority and indicates low efficiency percentage (below threshold) in the "Eff %" columns only</li>
-    </ul>
-    <p><strong>Straggler Information:</strong></p>
-    <ul>
-        <li><strong>Format:</strong> Total workers shown as "total[stragglers]" (e.g., "15[3]" = 15 workers, 3 stragglers)</li>
-        <li><span style="background-color: #ffcccc; padding: 2px 6px; border-radius: 3px;">Light red background</span> indicates cells with straggler workers</li>
-    </ul>
-    <p><strong>Difference Interpretation (Exec2 - Exec1):</strong></p>
-    <ul>
-        <li><span style="background-color: #add8e6; padding: 2px 6px; border-radius: 3px;">Light blue</span> indicates positive differences (Exec2 > Exec1)</li>
-        <li><span style="background-color: #fff8dc; padding: 2px 6px; border-radius: 3px;">Light yellow</span> indicates negative differences (Exec2 < Exec1)</li>
-        <li><strong>Positive execution time difference:</strong> Exec2 took longer</li>
-        <li><strong>Negative execution time difference:</strong> Exec2 was faster</li>
-    </ul>
-</div>
+        # Calculate efficiency metrics
+        exec1_used_cpu_time = exec1.total_used_cpu_time
+        exec1_inefficiency_percent = (exec1.cpu_inefficiency / exec1_used_cpu_time * 100) if exec1_used_cpu_time > 0 else 0
+        exec2_used_cpu_time = exec2.total_used_cpu_time
+        exec2_inefficiency_percent = (exec2.cpu_inefficiency / exec2_used_cpu_time * 100) if exec2_used_cpu_time > 0 else 0
+        
+        # Determine best efficiency percentage highlighting (separate from low-efficiency highlighting)
+        exec1_efficiency_percent_class = exec1_efficiency_class  # Start with low-efficiency class if applicable
+        exec2_efficiency_percent_class = exec2_efficiency_class  # Start with low-efficiency class if applicable
+        
+        # Add best efficiency highlighting only to percentage columns (only if not already low-efficiency)
+        exec1_efficiency_percent = exec1.average_cpu_efficiency_percent
+        exec2_efficiency_percent = exec2.average_cpu_efficiency_percent
+        if (exec1_efficiency_percent > 0 and exec2_efficiency_percent > 0 and 
+            exec1_efficiency_percent != exec2_efficiency_percent):
+            if exec1_efficiency_percent > exec2_efficiency_percent:
+                # Exec1 has better efficiency, highlight only if not low efficiency
+                if not exec1_efficiency_class:
+                    exec1_efficiency_percent_class = " best-efficiency"
+            else:
+                # Exec2 has better efficiency, highlight only if not low efficiency  
+                if not exec2_efficiency_class:
+                    exec2_efficiency_percent_class = " best-efficiency"
 
-</body>
-</html>"""
+        return HTML_ROW_TEMPLATE.format_map({
+            'migration_id_class': large_migration_class[1:],
+            # Each ID appears in exactly one row, so escaping it here does no more work than a precomputed list
+            'migration_id': escape(comp.migration_id),
+            'data_size_class': large_migration_class,
+            'data_size_gb': exec1.total_data_size_gb,
+            'exec1_time_class': exec1_time_class,
+            'exec1_time': exec1_time_str,
+            'exec2_time_class': exec2_time_class,
+            'exec2_time': exec2_time_str,
+            'exec_time_diff_class': exec_time_diff_class,
+            'exec_time_diff': exec_time_diff_str,
+            'exec1_workers_class': exec1_workers_class,
+            'exec1_workers': exec1_workers,
+            'exec2_workers_class': exec2_workers_class,
+            'exec2_workers': exec2_workers,
+            'worker_diff_class': worker_diff_class,
+            'worker_diff': worker_diff,
+            'exec1_cpus': exec1.total_cpus,
+            'exec2_cpus': exec2.total_cpus,
+            'cpu_diff_class': cpu_diff_class,
+            'cpu_diff': cpu_diff,
+            'exec1_cpu_time_class': exec1_cpu_time_class,
+            'exec1_cpu_time': exec1_cpu_time_str,
+            'exec2_cpu_time_class': exec2_cpu_time_class,
+            'exec2_cpu_time': exec2_cpu_time_str,
+            'cpu_time_diff_class': cpu_time_diff_class,
+            'cpu_time_diff': cpu_time_diff_str,
+            'exec1_efficiency_class': exec1_efficiency_class,
+            'exec1_efficiency_percent_class': exec1_efficiency_percent_class,
+            'exec1_active_cpu_time': exec1.total_active_cpu_time,
+            'exec1_efficiency_percent': exec1_efficiency_percent,
+            'exec1_inefficiency_percent': exec1_inefficiency_percent,
+            'exec2_efficiency_class': exec2_efficiency_class,
+            'exec2_efficiency_percent_class': exec2_efficiency_percent_class,
+            'exec2_active_cpu_time': exec2.total_active_cpu_time,
+            'exec2_efficiency_percent': exec2_efficiency_percent,
+            'exec2_inefficiency_percent': exec2_inefficiency_percent,
+            'exec1_small_w_class': exec1_small_w_class,
+            'exec1_small_w': exec1_small_w,
+            'exec1_medium_w_class': exec1_medium_w_class,
+            'exec1_medium_w': exec1_medium_w,
+            'exec1_large_w_class': exec1_large_w_class,
+            'exec1_large_w': exec1_large_w,
+            'exec1_small_c': exec1_small_c,
+            'exec1_medium_c': exec1_medium_c,
+            'exec1_large_c': exec1_large_c,
+            'exec2_small_w_class': exec2_small_w_class,
+            'exec2_small_w': exec2_small_w,
+            'exec2_medium_w_class': exec2_medium_w_class,
+            'exec2_medium_w': exec2_medium_w,
+            'exec2_large_w_class': exec2_large_w_class,
+            'exec2_large_w': exec2_large_w,
+            'exec2_small_c': exec2_small_c,
+            'exec2_medium_c': exec2_medium_c,
+            'exec2_large_c': exec2_large_c,
+        })
+    
+    @classmethod
+    def _render_html_rows(cls, comparisons: List[TieredComparisonResult], data_size_threshold: float = None, efficiency_threshold: float = None) -> str:
+        """Render the HTML <tr> rows for the given comparisons, in order."""
+        # Threshold highlighting classes per row; the None checks branch once here rather than inside every row
+        if data_size_threshold is not None:
+            large_migration_classes = [" large-migration" if comp.exec1_metrics.total_data_size_gb >= data_size_threshold else "" for comp in comparisons]
+        else:
+            large_migration_classes = repeat("")
+        if efficiency_threshold is not None:
+            exec1_efficiency_classes = [" low-efficiency" if 0 < comp.exec1_metrics.average_cpu_efficiency_percent < efficiency_threshold else "" for comp in comparisons]
+            exec2_efficiency_classes = [" low-efficiency" if 0 < comp.exec2_metrics.average_cpu_efficiency_percent < efficiency_threshold else "" for comp in comparisons]
+        else:
+            exec1_efficiency_classes = exec2_efficiency_classes = repeat("")
         
-        return html
-
-    def _generate_config_comparison_html(self, comparisons: List[TieredComparisonResult], exec1_name: str = None, exec2_name: str = None) -> str:
+        render_row = cls._render_html_row
+        return "".join([render_row(comp, large_class, exec1_class, exec2_class)
+                        for comp, large_class, exec1_class, exec2_class
+                        in zip(comparisons, large_migration_classes, exec1_efficiency_classes, exec2_efficiency_classes)])
+    
+    def _generate_config_comparison_html(self, comparisons: List[TieredComparisonResult], exec1_name: str = None, exec2_name: str = None, config_comparison: Dict[str, any] = None) -> str:
         """Generate HTML for configuration comparison section."""
         if not comparisons:
             return "<p>No migrations available for configuration comparison.</p>"
         
-        # Configuration keys to compare (as requested by user)
-        config_keys = [
-            'small_tier_max_sstable_size_gb',
-            'small_tier_thread_subset_max_size_floor_gb', 
-            'small_tier_worker_num_threads',
-            'medium_tier_max_sstable_size_gb',
-            'medium_tier_thread_subset_max_size_floor_gb',
-            'medium_tier_worker_num_threads',
-            'optimize_packing_medium_subsets',
-            'skip_small_subsets',
-            'execution_mode',
-            'max_concurrent_workers'
-        ]
-        
-        # Use first comparison to get configuration values (should be same across all migrations in an execution)
-        first_comp = comparisons[0]
-        config_comparison = first_comp.get_config_comparison(config_keys)
+        if config_comparison is None:
+            config_comparison = self.compare_configs(comparisons)
         
-        exec1_short = exec1_name if exec1_name else "Exec1"
-        exec2_short = exec2_name if exec2_name else "Exec2"
+        exec1_short = escape(exec1_name) if exec1_name else "Exec1"
+        exec2_short = escape(exec2_name) if exec2_name else "Exec2"
         
-        html = f"""
+        parts = [f"""
         <table style="width: 100%; max-width: 800px;">
             <thead>
                 <tr>
@@ -1352,7 +1543,7 @@ class TieredComparisonAnalyzer:
                     <th style="text-align: center; width: 10%;">Status</th>
                 </tr>
             </thead>
-            <tbody>"""
+            <tbody>"""]
         
         for key, comparison in config_comparison.items():
             exec1_value = comparison['exec1']
@@ -1360,61 +1551,88 @@ class TieredComparisonAnalyzer:
             is_same = comparison['same']
             
             # Format None values
-            exec1_display = exec1_value if exec1_value is not None else "N/A"
-            exec2_display = exec2_value if exec2_value is not None else "N/A"
+            exec1_display = escape(str(exec1_value)) if exec1_value is not None else "N/A"
+            exec2_display = escape(str(exec2_value)) if exec2_value is not None else "N/A"
             
             status_class = "config-same" if is_same else "config-different"
             status_text = "✓" if is_same else "✗"
             status_title = "Same configuration" if is_same else "Different configuration"
             
-            html += f"""
+            parts.append(f"""
                 <tr class="{status_class}">
                     <td><strong>{key}</strong></td>
                     <td style="text-align: center;">{exec1_display}</td>
                     <td style="text-align: center;">{exec2_display}</td>
                     <td style="text-align: center;" title="{status_title}">{status_text}</td>
-                </tr>"""
+                </tr>""")
         
-        html += """
-            </tbody>
-        </table>
-        <p><strong>Legend:</strong> 
-            <span style="background-color: #e8f5e8; padding: 2px 6px; border-radius: 3px;">Green</span> = Same configuration, 
-            <span style="background-color: #ffe8e8; padding: 2px 6px; border-radius: 3px;">Light red</span> = Different configuration
-        </p>"""
+        parts.append(HTML_CONFIG_TABLE_FOOTER)
         
-        return html
+        return "".join(parts)
 
-    def save_html_report(self, comparisons: List[TieredComparisonResult], output_file: str, exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None, efficiency_threshold: float = None):
+    def save_html_report(self, comparisons: List[TieredComparisonResult], output_file: str, exec1_name: str = None, exec2_name: str = None, exec1_only: Set[str] = None, exec2_only: Set[str] = None, data_size_threshold: float = None, efficiency_threshold: float = None, config_comparison: Dict[str, any] = None):
         """Save the HTML comparison report to a file."""
-        html_content = self.generate_html_report(comparisons, exec1_name, exec2_name, exec1_only, exec2_only, data_size_threshold, efficiency_threshold)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream straight into the buffered file instead of materializing the whole page first
+        with open(output_file, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as f:
+            self.write_html_report(f, comparisons, exec1_name, exec2_name, exec1_only, exec2_only, data_size_threshold, efficiency_threshold, config_comparison)
         
         print(f"HTML comparison report saved to: {output_file}")
         print(f"Open in browser: file://{os.path.abspath(output_file)}")
 
+def _first_entry_ending_with(path: Path, suffix: str) -> Optional[str]:
+    """Return the path of the first directory entry whose name ends with suffix (None if none or unreadable).
+    
+    Dot-files (e.g. macOS "._" resource forks next to the real report) are never matched.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and not entry.name.startswith('.'):
+                    return entry.path
+    except OSError:
+        pass
+    return None
+
+# Top-level directories that identify the TieredStrategySimulation project root
+PROJECT_ROOT_INDICATORS = frozenset(['simple', 'tiered', 'comparison', 'utils'])
+
+def _dir_entry_names(path: str) -> Set[str]:
+    """Return the names of the entries in a directory (empty if it cannot be listed)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+@lru_cache(maxsize=1)
 def find_project_root() -> str:
     """Find the project root directory by looking for characteristic files/directories.
     
+    The result is cached, so repeated calls within one run do not walk the filesystem again.
+    Setting the TIERED_PROJECT_ROOT environment variable skips the search entirely.
+    
     Returns:
         Absolute path to the TieredStrategySimulation project root
         
     Raises:
-        FileNotFoundError: If project root cannot be determined
+        FileNotFoundError: If project root cannot be determined, or TIERED_PROJECT_ROOT
+            is not an existing directory
     """
+    # An explicitly configured root (e.g. on CI) needs no discovery
+    env_root = os.environ.get("TIERED_PROJECT_ROOT")
+    if env_root:
+        if not os.path.isdir(env_root):
+            raise FileNotFoundError(f"TIERED_PROJECT_ROOT is not a directory: {env_root}")
+        return os.path.abspath(env_root)
+    
     # Start from the script's directory
     current_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Look for indicators that we're in the TieredStrategySimulation project root
-    project_indicators = ['simple', 'tiered', 'comparison', 'utils']
-    
     # Walk up the directory tree to find the project root
     search_dir = current_dir
     for _ in range(5):  # Limit search to 5 levels up
-        # Check if this directory contains the expected project structure
-        if all(os.path.exists(os.path.join(search_dir, indicator)) for indicator in project_indicators):
+        # Check if this directory contains the expected project structure (one listing, not a stat per indicator)
+        if PROJECT_ROOT_INDICATORS.issubset(_dir_entry_names(search_dir)):
             return search_dir
         
         # Move up one directory
@@ -1424,19 +1642,17 @@ def find_project_root() -> str:
         search_dir = parent_dir
     
     # If not found by walking up, check if we're already in project root
-    if all(os.path.exists(indicator) for indicator in project_indicators):
-        return os.getcwd()
+    cwd = os.getcwd()
+    if PROJECT_ROOT_INDICATORS.issubset(_dir_entry_names(cwd)):
+        return cwd
     
     raise FileNotFoundError(
         "Could not find TieredStrategySimulation project root. "
         "Please run this script from within the project directory."
     )
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Compare Two Tiered Migration Simulation Results",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Usage examples shown at the end of --help
+CLI_EPILOG = """
 Examples:
   # Compare and save results to organized output directory (default - saves to comparison/output/tiered/my_analysis/)
   python comparison/tiered_comparison_tool.py --exec1 test_new_5 --exec2 test_new_6 --comparison-exec-name my_tiered_analysis
@@ -1453,13 +1669,40 @@ Examples:
   # Can be run from anywhere within the project:
   cd comparison && python tiered_comparison_tool.py --exec1 test_new_5 --exec2 test_new_6 --comparison-exec-name my_tiered_analysis
   cd TieredStrategySimulation && python comparison/tiered_comparison_tool.py --exec1 test_new_5 --exec2 test_new_6 --comparison-exec-name my_tiered_analysis
+  
+  # Skip project root discovery by setting it explicitly (e.g. on CI)
+  TIERED_PROJECT_ROOT=/path/to/TieredStrategySimulation python comparison/tiered_comparison_tool.py --exec1 test_new_5 --exec2 test_new_6 --comparison-exec-name my_tiered_analysis
         """
+
+def die(message: str) -> NoReturn:
+    """Report a fatal CLI error on stderr and exit with status 1."""
+    sys.stderr.write(f"Error: {message}\n")
+    raise SystemExit(1)
+
+class ResolveExecAction(argparse.Action):
+    """Store an execution name and resolve its run directory (tiered/output/{name}) at parse time."""
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            project_root = find_project_root()
+        except FileNotFoundError as e:
+            die(str(e))
+        setattr(namespace, self.dest, values)
+        setattr(namespace, f"{self.dest}_run_path", os.path.join(project_root, "tiered", "output", values))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare Two Tiered Migration Simulation Results",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=CLI_EPILOG
     )
     
     # Execution name arguments (recommended)
     parser.add_argument('--exec1', '-1',
+                       action=ResolveExecAction,
                        help='First tiered execution name (e.g., test_new_5). Path will be: tiered/output/{name}')
     parser.add_argument('--exec2', '-2',
+                       action=ResolveExecAction,
                        help='Second tiered execution name (e.g., test_new_6). Path will be: tiered/output/{name}')
     
     # Full path arguments (backward compatibility)
@@ -1488,6 +1731,14 @@ Examples:
     
     args = parser.parse_args()
     
+    # Find the project root once; it anchors execution names and the organized report directory
+    project_root = None
+    if (args.exec1 and args.exec2) or (args.comparison_exec_name and not args.omit_reports):
+        try:
+            project_root = find_project_root()
+        except FileNotFoundError as e:
+            die(str(e))
+    
     # No validation needed - organized reports are created automatically when comparison name is provided
     
     # Determine paths and execution names based on arguments
@@ -1500,15 +1751,10 @@ Examples:
         # Use execution names (recommended approach)
         exec1_name = args.exec1
         exec2_name = args.exec2
-        # Find project root and construct absolute paths
-        try:
-            project_root = find_project_root()
-            exec1_run_path = os.path.join(project_root, "tiered", "output", exec1_name)
-            exec2_run_path = os.path.join(project_root, "tiered", "output", exec2_name)
-            print(f"Project root: {project_root}")
-        except FileNotFoundError as e:
-            print(f"Error: {e}")
-            sys.exit(1)
+        # Run directories under the project root were resolved while parsing
+        exec1_run_path = args.exec1_run_path
+        exec2_run_path = args.exec2_run_path
+        print(f"Project root: {project_root}")
         print(f"Comparing tiered executions: {exec1_name} vs {exec2_name}")
         
     elif args.exec1_path and args.exec2_path:
@@ -1516,15 +1762,19 @@ Examples:
         exec1_run_path = args.exec1_path
         exec2_run_path = args.exec2_path
         # Extract execution names from paths if possible
-        exec1_name = Path(exec1_run_path).name if exec1_run_path else None
-        exec2_name = Path(exec2_run_path).name if exec2_run_path else None
+        exec1_name = os.path.basename(os.path.normpath(exec1_run_path)) if exec1_run_path else None
+        exec2_name = os.path.basename(os.path.normpath(exec2_run_path)) if exec2_run_path else None
         print(f"Comparing paths: {exec1_run_path} vs {exec2_run_path}")
         
     else:
-        print("Error: Must specify either:")
-        print("  --exec1 and --exec2 (recommended)")
-        print("  OR --exec1-path and --exec2-path")
-        sys.exit(1)
+        die("Must specify either:\n"
+            "  --exec1 and --exec2 (recommended)\n"
+            "  OR --exec1-path and --exec2-path")
+    
+    # Fail fast on a missing run directory instead of after extracting the other execution
+    for run_path in (exec1_run_path, exec2_run_path):
+        if not os.path.isdir(run_path):
+            die(f"Tiered run path not found: {run_path}")
     
     try:
         analyzer = TieredComparisonAnalyzer()
@@ -1548,29 +1798,24 @@ Examples:
         # Handle output file generation
         if args.comparison_exec_name and not args.omit_reports:
             # Generate organized output under tiered directory (default behavior)
-            try:
-                project_root = find_project_root()
-                output_dir = os.path.join(project_root, "comparison", "output", "tiered", args.comparison_exec_name)
-                os.makedirs(output_dir, exist_ok=True)
-            except FileNotFoundError as e:
-                print(f"Error: {e}")
-                sys.exit(1)
+            output_dir = Path(project_root, "comparison", "output", "tiered", args.comparison_exec_name)
+            output_dir.mkdir(parents=True, exist_ok=True)
             
             # Generate default filenames
-            csv_file = f"{output_dir}/tiered_comparison_report_{args.comparison_exec_name}.csv"
-            txt_file = f"{output_dir}/tiered_comparison_summary_{args.comparison_exec_name}.txt"
-            html_file = f"{output_dir}/tiered_comparison_report_{args.comparison_exec_name}.html"
+            csv_file = output_dir / f"tiered_comparison_report_{args.comparison_exec_name}.csv"
+            txt_file = output_dir / f"tiered_comparison_summary_{args.comparison_exec_name}.txt"
+            html_file = output_dir / f"tiered_comparison_report_{args.comparison_exec_name}.html"
             
-            # Save all report formats
-            analyzer.save_comparison_csv(comparisons, csv_file, exec1_name, exec2_name, args.data_size_threshold, args.efficiency_threshold)
-            analyzer.save_comparison_report(comparisons, txt_file, exec1_name, exec2_name, exec1_only, exec2_only, args.data_size_threshold)
-            analyzer.save_html_report(comparisons, html_file, exec1_name, exec2_name, exec1_only, exec2_only, args.data_size_threshold, args.efficiency_threshold)
+            # Save all report formats, comparing the execution configs once for all three
+            config_comparison = analyzer.compare_configs(comparisons)
+            analyzer.save_comparison_csv(comparisons, csv_file, exec1_name, exec2_name, args.data_size_threshold, args.efficiency_threshold, config_comparison)
+            analyzer.save_comparison_report(comparisons, txt_file, exec1_name, exec2_name, exec1_only, exec2_only, args.data_size_threshold, config_comparison)
+            analyzer.save_html_report(comparisons, html_file, exec1_name, exec2_name, exec1_only, exec2_only, args.data_size_threshold, args.efficiency_threshold, config_comparison)
             
             print(f"Tiered comparison analysis saved to: {output_dir}/")
         
     except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+        die(str(e))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file